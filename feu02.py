@@ -1,9 +1,93 @@
+import mmap
+import os
+import struct
 import sys
+import tempfile
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel, --numpy revient alors au moteur pur Python
+    np = None
 
 
 # Fonctions utilitaires:
 
+class IndexedBoardRows:
+    
+    """
+    Lignes du tableau lues à la demande dans le fichier projeté en mémoire (mmap).
+
+    S'utilise comme la liste de read_board_rows (len() et accès par indice) sans
+    charger tout le tableau : seules les lignes touchées sont décodées, et les
+    dernières lues sont gardées dans un petit cache.
+    """
+    
+    CACHE_SIZE = 64
+    
+    def __init__(self, board: Path, row_starts: array, row_ends: array):
+        self.board = board
+        self.row_starts = row_starts
+        self.row_ends = row_ends
+        self.cached_rows = {}
+        self.data = None
+    
+    def __len__(self) -> int:
+        return len(self.row_starts)
+    
+    def __getitem__(self, y: int) -> str:
+        row = self.cached_rows.get(y)
+        if row is None:
+            if len(self.cached_rows) >= self.CACHE_SIZE:
+                self.cached_rows.clear()
+            start, end = self.row_starts[y], self.row_ends[y]
+            if self.data is None:
+                # Projeté au premier accès : un index périmé ne touche jamais au tableau
+                with self.board.open("rb") as board_file:
+                    self.data = mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_READ)
+            row = self.data[start:end].decode("utf-8")
+            self.cached_rows[y] = row
+        return row
+
+class BoardIndex:
+    
+    """
+    Index persistant d'un tableau : bornes de chaque ligne, et pour chaque
+    caractère la liste triée de ses positions y * largeur + x.
+
+    Les positions restent dans le fichier d'index ; seules celles du caractère
+    demandé sont lues, avec read_positions. Le fichier reste ouvert : s'il est
+    remplacé par une autre requête, c'est toujours celui qui a été vérifié qui
+    est lu.
+    """
+    
+    def __init__(self, board: Path, index_file: BinaryIO, width: int, row_starts: array, row_ends: array,
+                 position_blocks: dict[str, tuple[int, str, int]]):
+        self.board = board
+        self.index_file = index_file
+        self.width = width
+        self.row_starts = row_starts
+        self.row_ends = row_ends
+        self.position_blocks = position_blocks  # caractère -> (offset dans l'index, type, nombre)
+        self.rows = IndexedBoardRows(board, row_starts, row_ends)
+    
+    def count(self, char: str) -> int:
+        return self.position_blocks[char][2] if char in self.position_blocks else 0
+    
+    def read_positions(self, char: str) -> array:
+        positions = array("I")
+        if char not in self.position_blocks:
+            return positions
+        offset, typecode, count = self.position_blocks[char]
+        positions = array(typecode)
+        self.index_file.seek(offset)
+        positions.fromfile(self.index_file, count)
+        return positions
+
 def transform_board_into_list_of_lists(board: Path) -> list[list[str]]:
     
     """
@@ -53,47 +137,498 @@ def display_overlay_board(board: list[list[str]], board_to_find: list[list[str]]
     Seuls les caractères du motif (non espaces) sont affichés, le reste est remplacé par '-'.
     
     Args:
-        board (list[list[str]]): Tableau principal
+        board (list[list[str]]): Tableau principal (les lignes peuvent aussi être des chaînes)
         board_to_find (list[list[str]]): Motif trouvé
         found_x (int): Coordonnée x où le motif a été trouvé
         found_y (int): Coordonnée y où le motif a été trouvé'''
     
+    width = len(board[0])  # Utilisation de len(board[0]) pour les colonnes
+    pattern_width = min(len(board_to_find[0]), max(width - found_x, 0)) if board_to_find else 0
+    empty_row = "-" * width
     for i in range(len(board)):
-        row_str = ""
-        for j in range(len(board[0])):  # Utilisation de len(board[0]) pour les colonnes
-            # Vérifie si la cellule fait partie de la zone du motif trouvé
-            if (found_y <= i < found_y + len(board_to_find) and 
-                found_x <= j < found_x + len(board_to_find[0])):
-                
-                # Position relative dans le motif
-                rel_i = i - found_y
-                rel_j = j - found_x
-                pattern_char = board_to_find[rel_i][rel_j]
-                
-                # Affiche le caractère uniquement si le pattern le spécifie
-                row_str += board[i][j] if pattern_char != " " else "-"
-            else:
-                row_str += "-"
-        print(row_str)
+        # Les lignes hors de la zone du motif ne contiennent que des '-'
+        if not found_y <= i < found_y + len(board_to_find):
+            print(empty_row)
+            continue
+        
+        # Affiche le caractère uniquement si le pattern le spécifie
+        pattern_row = board_to_find[i - found_y]
+        overlay = "".join(board[i][found_x + j] if j < len(pattern_row) and pattern_row[j] != " " else "-"
+                          for j in range(pattern_width))
+        print(empty_row[:found_x] + overlay + empty_row[found_x + pattern_width:])
+
+def read_board_rows(board: Path) -> list[str]:
+    
+    """
+    Lit le tableau sous forme de liste de chaînes, une par ligne.
+
+    Plus léger qu'une liste de listes de caractères sur les grands tableaux, et
+    permet de chercher avec str.find et de comparer des tranches de lignes.
+    """
+
+    return board.read_text().splitlines()
+
+def find_solid_runs(board_to_find: list[list[str]]) -> list[tuple[int, int, str]]:
+    
+    """
+    Découpe le motif en segments pleins : suites de caractères sans espace sur une ligne.
+
+    Args:
+        board_to_find (list[list[str]]): Motif, dont la largeur est celle de sa première ligne
+
+    Returns:
+        list[tuple[int, int, str]]: (ligne, colonne, texte) de chaque segment
+    """
+    
+    width = len(board_to_find[0]) if board_to_find else 0
+    runs = []
+    for i, pattern_row in enumerate(board_to_find):
+        line = "".join(pattern_row[:width])
+        j = 0
+        for segment in line.split(" "):
+            if segment:
+                runs.append((i, j, segment))
+            j += len(segment) + 1
+    return runs
+
+def iter_pattern_matches(board_rows: list[str], board_to_find: list[list[str]],
+                         width: Optional[int] = None) -> Iterator[tuple[int, int]]:
+    
+    """
+    Énumère les positions (x, y) où le motif correspond, dans l'ordre du parcours
+    de la recherche exhaustive (y croissant, puis x croissant).
+
+    Le plus long segment plein du motif sert d'ancre : il est cherché avec str.find
+    dans chaque ligne candidate du tableau, et seuls ses emplacements sont vérifiés
+    en comparant les autres segments par tranches. Les espaces du motif restent
+    des jokers.
+
+    Args:
+        board_rows (list[str]): Lignes du tableau
+        board_to_find (list[list[str]]): Motif à trouver
+        width (Optional[int]): Largeur du tableau, si board_rows n'en est qu'une bande
+    """
+    
+    if not board_rows:
+        return
+    if width is None:
+        width = len(board_rows[0])
+    pattern_height = len(board_to_find)
+    pattern_width = len(board_to_find[0]) if board_to_find else 0
+    last_x = min(width - 1, width - pattern_width)
+    last_y = min(len(board_rows) - 1, len(board_rows) - pattern_height)
+    if last_x < 0 or last_y < 0:
+        return
+    runs = find_solid_runs(board_to_find)
+    
+    if not runs:
+        # Motif vide ou uniquement composé d'espaces : il correspond partout
+        for y in range(last_y + 1):
+            for x in range(last_x + 1):
+                yield x, y
+        return
+    
+    # str.find saute d'une occurrence de l'ancre à la suivante sans repasser par les autres positions
+    anchor_i, anchor_j, anchor = max(runs, key=lambda run: len(run[2]))
+    others = [run for run in runs if run[:2] != (anchor_i, anchor_j)]
+    for y in range(last_y + 1):
+        row = board_rows[y + anchor_i]
+        end = last_x + anchor_j + len(anchor)
+        position = row.find(anchor, anchor_j, end)
+        while position >= 0:
+            x = position - anchor_j
+            if all(board_rows[y + i].startswith(segment, x + j) for i, j, segment in others):
+                yield x, y
+            position = row.find(anchor, position + 1, end)
+
+def load_board_array(board_rows: list[str]) -> Optional["np.ndarray"]:
+    
+    """
+    Charge le tableau dans un tableau NumPy d'octets de largeur len(board_rows[0]).
+
+    Les lignes plus courtes sont complétées par des octets nuls, qui ne
+    correspondent à aucun caractère du motif. Renvoie None si le tableau
+    n'est pas en ASCII.
+    """
+    
+    width = len(board_rows[0])
+    try:
+        data = b"".join(row[:width].encode("ascii").ljust(width, b"\0") for row in board_rows)
+    except UnicodeEncodeError:
+        return None
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(board_rows), width)
+
+def iter_pattern_matches_numpy(board_rows: list[str], board_to_find: list[list[str]]) -> Iterator[tuple[int, int]]:
+    
+    """
+    Énumère les positions (x, y) où le motif correspond, comme iter_pattern_matches,
+    en testant toutes les positions à la fois avec NumPy.
+
+    Chaque case pleine du motif est comparée à une vue décalée du tableau, et
+    les masques d'égalité sont combinés ; les espaces du motif sont des jokers
+    et ne sont pas testés. Le tableau est traité par blocs de lignes pour
+    borner la mémoire et s'arrêter tôt quand seul le premier résultat compte.
+    Sans NumPy, ou si le tableau ou le motif ne sont pas en ASCII, la
+    recherche passe par iter_pattern_matches.
+    """
+    
+    board = load_board_array(board_rows) if np is not None and board_rows else None
+    solid_cells = [(i, j, char) for i, j, segment in find_solid_runs(board_to_find)
+                   for j, char in enumerate(segment, j)]
+    if board is None or not all(char.isascii() for _, _, char in solid_cells):
+        yield from iter_pattern_matches(board_rows, board_to_find)
+        return
+    
+    height, width = board.shape
+    pattern_height = len(board_to_find)
+    pattern_width = len(board_to_find[0]) if board_to_find else 0
+    last_x = min(width - 1, width - pattern_width)
+    last_y = min(height - 1, height - pattern_height)
+    if last_x < 0 or last_y < 0:
+        return
+    
+    block_height = max(1, 4_000_000 // width)
+    for first_y in range(0, last_y + 1, block_height):
+        block_end = min(first_y + block_height, last_y + 1)
+        matches = np.ones((block_end - first_y, last_x + 1), dtype=bool)
+        for i, j, char in solid_cells:
+            matches &= board[first_y + i:block_end + i, j:j + last_x + 1] == ord(char)
+        for y, x in zip(*np.nonzero(matches)):
+            yield int(x), first_y + int(y)
+
+def iter_pattern_matches_indexed(board_index: BoardIndex, board_to_find: list[list[str]]) -> Iterator[tuple[int, int]]:
+    
+    """
+    Énumère les positions (x, y) où le motif correspond, comme iter_pattern_matches,
+    à partir de l'index du tableau.
 
-def find_position_on_board(board_list: list[list[str]], board_to_find_list: list[list[str]]) -> None:
+    Seules les positions du caractère plein du motif le plus rare dans le tableau
+    sont candidates ; elles sont recoupées avec les positions des cases suivantes,
+    puis vérifiées en lisant les lignes concernées à la demande. Quand ce caractère
+    est trop fréquent pour que cela vaille la peine, la recherche passe par
+    iter_pattern_matches sur les mêmes lignes.
+    """
+    
+    board_rows = board_index.rows
+    if not len(board_rows):
+        return
+    width, height = board_index.width, len(board_rows)
+    pattern_height = len(board_to_find)
+    pattern_width = len(board_to_find[0]) if board_to_find else 0
+    last_x = min(width - 1, width - pattern_width)
+    last_y = min(height - 1, height - pattern_height)
+    if last_x < 0 or last_y < 0:
+        return
+    runs = find_solid_runs(board_to_find)
+    solid_cells = [(i, j, char) for i, j, segment in runs for j, char in enumerate(segment, j)]
+    if not solid_cells:
+        yield from iter_pattern_matches(board_rows, board_to_find)
+        return
+    
+    # Cases pleines de la plus rare à la plus fréquente dans le tableau
+    solid_cells.sort(key=lambda cell: board_index.count(cell[2]))
+    if board_index.count(solid_cells[0][2]) * INDEX_SCAN_RATIO > width * height:
+        yield from iter_pattern_matches(board_rows, board_to_find)
+        return
+    
+    # Les positions de la case la plus rare sont filtrées par celles des suivantes (décalées
+    # de l'écart entre les deux cases), tant que cela coûte moins que de vérifier les lignes
+    first_i, first_j, first_char = solid_cells[0]
+    first_shift = first_i * width + first_j
+    candidates = set(board_index.read_positions(first_char))
+    for i, j, char in solid_cells[1:]:
+        if not candidates or board_index.count(char) > len(candidates) * INDEX_FILTER_RATIO:
+            break
+        candidates.intersection_update(map((first_shift - i * width - j).__add__, board_index.read_positions(char)))
+    
+    for origin in sorted(candidates):
+        y, x = divmod(origin - first_shift, width)
+        if (x <= last_x and 0 <= y <= last_y
+                and all(board_rows[y + i].startswith(segment, x + j) for i, j, segment in runs)):
+            yield x, y
+
+PARALLEL_BANDS_PER_WORKER = 4  # des bandes plus petites limitent le travail perdu après une correspondance
+
+def search_board_band(board: Path, start: int, end: int, width: int, board_to_find: list[list[str]],
+                      first_only: bool) -> tuple[int, list[tuple[int, int]]]:
+    
+    """
+    Cherche le motif dans une bande du tableau, dans un processus séparé.
+
+    La bande couvre les octets start à end du fichier, qui commencent chacun une
+    ligne. Le processus les lit lui-même dans le fichier projeté en mémoire, avec
+    les len(board_to_find) - 1 lignes suivantes que la bande partage avec la
+    suivante : seules ses propres lignes sont des origines possibles.
+
+    Args:
+        start, end (int): Bornes de la bande en octets dans le fichier
+        first_only (bool): S'arrêter à la première correspondance de la bande
+
+    Returns:
+        tuple: (nombre de lignes de la bande, positions (x, y) relatives à sa première
+        ligne, dans l'ordre de iter_pattern_matches)
+    """
+    
+    with board.open("rb") as board_file, mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        band_rows = data[start:end].decode("utf-8").splitlines()
+        row_count = len(band_rows)
+        shared_end = end
+        for _ in range(len(board_to_find) - 1):
+            shared_end = data.find(b"\n", shared_end) + 1 or len(data)
+        band_rows += data[end:shared_end].decode("utf-8").splitlines()[:len(board_to_find) - 1]
+    matches = []
+    for x, y in iter_pattern_matches(band_rows, board_to_find, width):
+        matches.append((x, y))
+        if first_only:
+            break
+    return row_count, matches
+
+def split_board_bands(data: mmap.mmap, band_count: int) -> list[tuple[int, int]]:
+    """Découpe le fichier en band_count bandes d'octets de même taille, arrêtées en fin de ligne."""
+    bounds = [0]
+    for band in range(1, band_count):
+        bound = data.find(b"\n", max(len(data) * band // band_count, bounds[-1])) + 1
+        if bound == 0:
+            break
+        if bound > bounds[-1]:
+            bounds.append(bound)
+    if bounds[-1] < len(data):
+        bounds.append(len(data))
+    return list(zip(bounds, bounds[1:]))
+
+def iter_pattern_matches_parallel(board: Path, board_to_find: list[list[str]], workers: int,
+                                  first_only: bool = False) -> Iterator[tuple[int, int]]:
+    
+    """
+    Énumère les positions (x, y) où le motif correspond, comme iter_pattern_matches,
+    en cherchant des bandes horizontales du tableau dans plusieurs processus.
+
+    Le processus principal ne lit pas le tableau : il coupe le fichier en bandes
+    d'octets à la fin de ligne la plus proche, et chaque processus lit et décode
+    la sienne. Leurs résultats sont rendus dans l'ordre des bandes, en comptant
+    leurs lignes pour retrouver y : la première correspondance sort dès que toutes
+    les bandes précédentes sont terminées sans en trouver. Au plus 2 bandes par
+    processus sont en attente, et celles qui n'ont pas commencé sont annulées si
+    la recherche s'arrête avant la fin.
+    """
+    
+    with board.open("rb") as board_file:
+        first_line = board_file.readline()
+        if not first_line:
+            return
+        with mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            bands = split_board_bands(data, 1 if workers == 1 else PARALLEL_BANDS_PER_WORKER * workers)
+    first_rows = first_line.decode("utf-8").splitlines()
+    width = len(first_rows[0]) if first_rows else 0
+    
+    if workers == 1:
+        _, matches = search_board_band(board, 0, bands[0][1], width, board_to_find, first_only)
+        yield from matches
+        return
+    
+    first_y = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for start, end in bands:
+                pending.append(executor.submit(search_board_band, board, start, end, width,
+                                               board_to_find, first_only))
+                if len(pending) >= 2 * workers:
+                    row_count, matches = pending.popleft().result()
+                    yield from ((x, first_y + y) for x, y in matches)
+                    first_y += row_count
+            while pending:
+                row_count, matches = pending.popleft().result()
+                yield from ((x, first_y + y) for x, y in matches)
+                first_y += row_count
+        finally:
+            for future in pending:
+                future.cancel()
+
+def build_anchor_automaton(anchors: list[str]) -> tuple[dict[str, int], list[int], list[Optional[list[int]]]]:
+    
+    """
+    Construit l'automate d'Aho–Corasick qui reconnaît toutes les ancres en une seule lecture.
+
+    Les caractères des ancres reçoivent les codes 1..k, tous les autres le code 0.
+    Les transitions sont précalculées pour chaque (état, code) dans une liste
+    plate, et les états y sont stockés multipliés par k + 1 : une lecture de
+    caractère coûte une addition et un accès à la liste.
+
+    Args:
+        anchors (list[str]): Textes à reconnaître (non vides)
+
+    Returns:
+        tuple: (codes des caractères, transitions, ancres reconnues par état)
+    """
     
-    '''Recherche le motif board_to_find_list dans board_list et affiche sa position si trouvé.
+    char_codes = {char: code for code, char in enumerate(sorted(set("".join(anchors))), 1)}
+    alphabet_size = len(char_codes) + 1
     
+    # Trie des ancres
+    children = [{}]
+    terminal = [[]]
+    for anchor_index, anchor in enumerate(anchors):
+        state = 0
+        for char in anchor:
+            code = char_codes[char]
+            if code not in children[state]:
+                children[state][code] = len(children)
+                children.append({})
+                terminal.append([])
+            state = children[state][code]
+        terminal[state].append(anchor_index)
+    
+    # Liens d'échec en largeur, puis transitions complètes
+    transitions = [0] * (len(children) * alphabet_size)
+    outputs = [None] * (len(children) * alphabet_size)
+    failure = [0] * len(children)
+    queue = deque()
+    for code, child in children[0].items():
+        transitions[code] = child * alphabet_size
+        queue.append(child)
+    while queue:
+        state = queue.popleft()
+        # L'état d'échec, moins profond, a déjà reçu toutes ses ancres
+        terminal[state] += terminal[failure[state]]
+        outputs[state * alphabet_size] = terminal[state] or None
+        fallback = failure[state] * alphabet_size
+        for code in range(alphabet_size):
+            child = children[state].get(code)
+            if child is None:
+                transitions[state * alphabet_size + code] = transitions[fallback + code]
+            else:
+                failure[child] = transitions[fallback + code] // alphabet_size
+                transitions[state * alphabet_size + code] = child * alphabet_size
+                queue.append(child)
+    return char_codes, transitions, outputs
+
+def iter_multi_pattern_matches(board_rows: list[str], patterns: list[list[list[str]]],
+                               first_only: bool = False) -> Iterator[tuple[int, int, int]]:
+    
+    """
+    Cherche plusieurs motifs en une seule lecture du tableau.
+
+    Les ancres (plus long segment plein) de tous les motifs sont reconnues
+    ensemble par un automate d'Aho–Corasick, ligne par ligne ; chaque ancre
+    reconnue donne une position candidate, vérifiée en comparant les autres
+    segments du motif. Pour chaque motif, les positions sortent dans l'ordre
+    de iter_pattern_matches. Avec first_only, un motif est abandonné dès sa
+    première correspondance et la lecture s'arrête quand tous sont trouvés.
+
     Args:
-        board_list (list[list[str]]): Tableau principal dans lequel chercher
-        board_to_find_list (list[list[str]]): Motif à trouver'''
+        board_rows (list[str]): Lignes du tableau
+        patterns (list[list[list[str]]]): Motifs à trouver
+
+    Returns:
+        Iterator[tuple[int, int, int]]: (indice du motif, x, y)
+    """
+    
+    if not board_rows:
+        return
+    width, height = len(board_rows[0]), len(board_rows)
+    anchors = []
+    anchor_entries = []
+    others = []
+    limits = []
+    pending = set()
+    for index, board_to_find in enumerate(patterns):
+        pattern_width = len(board_to_find[0]) if board_to_find else 0
+        limits.append((min(width - 1, width - pattern_width), min(height - 1, height - len(board_to_find))))
+        runs = find_solid_runs(board_to_find)
+        if limits[-1][0] < 0 or limits[-1][1] < 0:
+            others.append([])
+            continue
+        if not runs:
+            # Motif sans caractère plein : il correspond partout, pas besoin de l'automate
+            for x, y in iter_pattern_matches(board_rows, board_to_find):
+                yield index, x, y
+                if first_only:
+                    break
+            others.append([])
+            continue
+        anchor_i, anchor_j, anchor = max(runs, key=lambda run: len(run[2]))
+        others.append([run for run in runs if run[:2] != (anchor_i, anchor_j)])
+        anchors.append(anchor)
+        # La fin de l'ancre est lue en colonne x + anchor_j + len(anchor) - 1
+        anchor_entries.append((index, anchor_i, anchor_j + len(anchor) - 1))
+        pending.add(index)
+    if not anchors:
+        return
+    
+    char_codes, transitions, outputs = build_anchor_automaton(anchors)
+    byte_codes = bytes(char_codes.get(chr(byte), 0) for byte in range(128)) + bytes(128)
+    for row_index, row in enumerate(board_rows):
+        if row.isascii():
+            codes = row.encode("ascii").translate(byte_codes)
+        else:
+            codes = [char_codes.get(char, 0) for char in row]
+        state = 0
+        for end, code in enumerate(codes):
+            state = transitions[state + code]
+            found = outputs[state]
+            if found is None:
+                continue
+            for anchor_index in found:
+                index, anchor_i, anchor_end = anchor_entries[anchor_index]
+                x, y = end - anchor_end, row_index - anchor_i
+                last_x, last_y = limits[index]
+                if (0 <= x <= last_x and 0 <= y <= last_y and index in pending
+                        and all(board_rows[y + i].startswith(segment, x + j) for i, j, segment in others[index])):
+                    yield index, x, y
+                    if first_only:
+                        pending.discard(index)
+        if first_only and not pending:
+            return
+
+def iter_pattern_matches_brute_force(board_list: list[list[str]], board_to_find_list: list[list[str]]) -> Iterator[tuple[int, int]]:
+    
+    '''Énumère les positions (x, y) où le motif correspond en appelant check_match partout.'''
     
     for y in range(len(board_list)):
         for x in range(len(board_list[0])):
             if check_match(board_list, board_to_find_list, x, y):
-                print(f"Trouvé !\nCoordonnées : {x},{y}")
-                display_overlay_board(board_list, board_to_find_list, x, y)
-                return
-    print("Introuvable")
-        
+                yield x, y
+
 # Gestion d'erreurs :
 
+KNOWN_OPTIONS = {'brute-force', 'all', 'count', 'numpy', 'multi', 'index', 'parallel', 'workers'}
+
+def has_known_options(options: dict[str, str]) -> bool:
+    for name in options:
+        if name not in KNOWN_OPTIONS:
+            print(f"Erreur : Option inconnue '--{name}'")
+            return False
+    return True
+
+def get_positive_int_option(options: dict[str, str], name: str, default: int) -> Optional[int]:
+    """Lit une option entière strictement positive (ex: '--workers=4')."""
+    if name not in options:
+        return default
+    value = options[name]
+    if not value.isdigit() or int(value) == 0:
+        print(f"Erreur : L'option --{name} attend un entier strictement positif")
+        return None
+    return int(value)
+
+MULTI_INCOMPATIBLE_OPTIONS = ('brute-force', 'numpy', 'index', 'parallel', 'workers')
+PARALLEL_INCOMPATIBLE_OPTIONS = ('brute-force', 'numpy', 'index')
+
+def are_compatible_options(options: dict[str, str], mode: str, incompatible_options: tuple[str, ...]) -> bool:
+    for name in incompatible_options:
+        if name in options:
+            print(f"Erreur : L'option --{name} ne s'utilise pas avec --{mode}")
+            return False
+    return True
+
+def are_valid_parallel_options(options: dict[str, str]) -> bool:
+    if 'parallel' not in options:
+        if 'workers' in options:
+            print("Erreur : L'option --workers ne s'utilise qu'avec --parallel")
+            return False
+        return True
+    return are_compatible_options(options, 'parallel', PARALLEL_INCOMPATIBLE_OPTIONS)
+
 def is_valid_length(arguments: list[str]) -> bool:
     if len(arguments) != 2:
         print("Erreur : Merci d'indiquer deux arguments qui sont les noms de fichiers que vous "
@@ -101,6 +636,22 @@ def is_valid_length(arguments: list[str]) -> bool:
         return False
     return True
 
+def is_valid_multi_length(arguments: list[str]) -> bool:
+    if len(arguments) < 2:
+        print("Erreur : Merci d'indiquer le fichier du tableau puis au moins un fichier ou "
+        "dossier de motifs")
+        return False
+    return True
+
+def are_valid_pattern_sources(arguments: list[str]) -> bool:
+    all_sources_exist = True
+    for argument in arguments:
+        source = Path(argument)
+        if not source.is_file() and not source.is_dir():
+            print(f"Erreur : {source} n'est ni un fichier ni un dossier, veuillez rentrer un nom valide")
+            all_sources_exist = False
+    return all_sources_exist
+
 def is_valid_file(arguments: list[str]) -> bool:
     all_files_exist = True
     for argument in arguments:
@@ -115,6 +666,193 @@ def get_arguments() -> list[str]:
     arguments = sys.argv[1:]
     return arguments
 
+def split_arguments(arguments: list[str]) -> tuple[list[str], dict[str, str]]:
+    positional = []
+    options = {}
+    for argument in arguments:
+        if argument.startswith('--'):
+            name, _, value = argument[2:].partition('=')
+            options[name] = value
+        else:
+            positional.append(argument)
+    return positional, options
+
+def collect_pattern_files(arguments: list[str]) -> list[Path]:
+    """Liste les fichiers de motifs : les fichiers donnés, et ceux des dossiers donnés (triés par nom)."""
+    pattern_files = []
+    for argument in arguments:
+        source = Path(argument)
+        if source.is_dir():
+            pattern_files.extend(sorted(path for path in source.iterdir() if path.is_file()))
+        else:
+            pattern_files.append(source)
+    return pattern_files
+
+# Index du tableau enregistré à côté de celui-ci
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'FEU02I02'
+INDEX_HEADER = struct.Struct('<8sqqI')  # magic, mtime du tableau (ns), taille du tableau, nombre de tableaux
+INDEX_ARRAY_HEADER = struct.Struct('<cq')  # type du tableau, nombre d'éléments
+INDEX_SCAN_RATIO = 64  # au-delà d'un candidat pour 64 cases, str.find sur toutes les lignes va plus vite
+INDEX_FILTER_RATIO = 16  # une position filtrée coûte environ 16 fois moins qu'un candidat vérifié
+
+def get_index_path(board: Path) -> Path:
+    """Retourne le chemin du fichier d'index associé au tableau (ex: 'board.txt.idx')."""
+    return board.with_name(board.name + INDEX_SUFFIX)
+
+def split_board_bytes(data: bytes) -> tuple[list[str], array, array]:
+    
+    """
+    Découpe le contenu du tableau en lignes, comme read_board_rows.
+
+    Returns:
+        tuple: (lignes, début et fin de chaque ligne en octets dans le fichier)
+    """
+    
+    rows = []
+    row_starts, row_ends = array('q'), array('q')
+    offset = 0
+    for line in data.decode('utf-8').splitlines(keepends=True):
+        row = line.splitlines()[0]
+        row_bytes = row.encode('utf-8')
+        rows.append(row)
+        row_starts.append(offset)
+        row_ends.append(offset + len(row_bytes))
+        offset += len(line.encode('utf-8')) if not line.isascii() else len(line)
+    return rows, row_starts, row_ends
+
+def build_position_arrays(rows: list[str], width: int) -> dict[str, array]:
+    
+    """
+    Calcule, pour chaque caractère des width premières colonnes, ses positions y * width + x
+    triées. Avec NumPy et un tableau ASCII, chaque caractère est localisé en une passe.
+    """
+    
+    typecode = 'I' if len(rows) * width < 1 << 32 else 'q'
+    board = load_board_array(rows) if np is not None and rows and width else None
+    if board is not None:
+        # Les octets nuls de remplissage sont indexés aussi : leurs positions sont rejetées à la vérification
+        counts = np.bincount(board.ravel(), minlength=256)
+        dtype = np.uint32 if typecode == 'I' else np.int64
+        positions = {}
+        for code in np.nonzero(counts)[0]:
+            positions[chr(code)] = array(typecode, np.flatnonzero(board == code).astype(dtype).tobytes())
+        return positions
+    
+    positions = {}
+    for y, row in enumerate(rows):
+        for position, char in enumerate(row[:width], y * width):
+            if char not in positions:
+                positions[char] = array(typecode)
+            positions[char].append(position)
+    return positions
+
+def read_board_index(board: Path) -> Optional[tuple[int, int, BoardIndex]]:
+    
+    """
+    Lit l'index du tableau, sans vérifier qu'il est à jour.
+
+    Retourne None si l'index n'existe pas ou est illisible (y compris un bloc
+    de positions qui dépasse la fin du fichier), sinon (mtime du tableau,
+    taille du tableau, index) tels qu'enregistrés.
+    """
+    
+    index_path = get_index_path(board)
+    if not index_path.is_file():
+        return None
+    
+    try:
+        index_file = index_path.open('rb')
+    except OSError:
+        return None
+    try:
+        index_size = os.fstat(index_file.fileno()).st_size
+        magic, mtime_ns, size, array_count = INDEX_HEADER.unpack(index_file.read(INDEX_HEADER.size))
+        if magic != INDEX_MAGIC or array_count < 4:
+            raise ValueError("index inconnu")
+        arrays = []
+        for _ in range(4):
+            typecode, count = INDEX_ARRAY_HEADER.unpack(index_file.read(INDEX_ARRAY_HEADER.size))
+            values = array(typecode.decode())
+            values.fromfile(index_file, count)
+            arrays.append(values)
+        (width,), row_starts, row_ends, chars = arrays
+        if array_count != 4 + len(chars):
+            raise ValueError("nombre de tableaux incohérent")
+        # Les positions de chaque caractère ne sont pas lues, seulement repérées dans le fichier
+        position_blocks = {}
+        for char in chars:
+            typecode, count = INDEX_ARRAY_HEADER.unpack(index_file.read(INDEX_ARRAY_HEADER.size))
+            offset = index_file.tell()
+            position_blocks[chr(char)] = (offset, typecode.decode(), count)
+            index_file.seek(offset + count * array(typecode.decode()).itemsize)
+        if index_file.tell() > index_size:
+            raise EOFError("bloc de positions tronqué")
+    except (OSError, EOFError, struct.error, ValueError):
+        index_file.close()
+        return None
+    
+    return mtime_ns, size, BoardIndex(board, index_file, width, row_starts, row_ends, position_blocks)
+
+def save_board_index(board: Path, data: bytes) -> None:
+    
+    """
+    Construit l'index du tableau à partir de son contenu et l'enregistre, avec sa date et sa taille.
+
+    L'index est écrit dans un fichier temporaire à nom unique puis remplacé d'un
+    coup : deux requêtes simultanées n'écrivent jamais dans le même fichier.
+    """
+    
+    rows, row_starts, row_ends = split_board_bytes(data)
+    width = len(rows[0]) if rows else 0
+    positions = build_position_arrays(rows, width)
+    chars = sorted(positions)
+    arrays = [array('q', [width]), row_starts, row_ends, array('I', map(ord, chars))]
+    arrays += [positions[char] for char in chars]
+    
+    index_path = get_index_path(board)
+    board_stat = board.stat()
+    descriptor, temporary_name = tempfile.mkstemp(prefix=index_path.name + '.', suffix='.tmp',
+                                                  dir=index_path.parent)
+    try:
+        with os.fdopen(descriptor, 'wb') as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, board_stat.st_mtime_ns, board_stat.st_size,
+                                               len(arrays)))
+            for values in arrays:
+                index_file.write(INDEX_ARRAY_HEADER.pack(values.typecode.encode(), len(values)))
+                values.tofile(index_file)
+        os.replace(temporary_name, index_path)  # Un index à moitié écrit n'est jamais lu
+    except OSError:
+        os.unlink(temporary_name)
+        raise
+
+def get_board_index(board: Path) -> Optional[BoardIndex]:
+    
+    """
+    Charge l'index du tableau, ou le (re)construit et l'enregistre.
+
+    L'index est périmé dès que la date de modification ou la taille du tableau
+    change : il est alors reconstruit entièrement par save_board_index, qui
+    remplace l'ancien fichier d'un coup. Un index illisible ou tronqué est
+    reconstruit de même. Retourne None si l'index ne peut pas être écrit.
+    """
+    
+    board_stat = board.stat()
+    stored = read_board_index(board)
+    if stored is not None:
+        mtime_ns, size, board_index = stored
+        if mtime_ns == board_stat.st_mtime_ns and size == board_stat.st_size:
+            return board_index
+        board_index.index_file.close()
+    
+    try:
+        save_board_index(board, board.read_bytes())
+    except OSError:
+        return None
+    
+    stored = read_board_index(board)
+    return stored[2] if stored is not None else None
+
 # Résolution :
 
 
@@ -126,22 +864,129 @@ def display_coordonates_and_pattern() -> None:
     3. Recherche le motif
     4. Affiche le résultat
     '''
-    arguments = get_arguments()
+    arguments, options = split_arguments(get_arguments())
+
+    if not has_known_options(options):
+        return
+
+    if 'multi' in options:
+        search_multiple_patterns(arguments, options)
+        return
 
     if not is_valid_length(arguments):
         return
 
     if not is_valid_file(arguments):
         return
+
+    if not are_valid_parallel_options(options):
+        return
     
     board = Path(arguments[0])
     board_to_find = Path(arguments[1])
 
-    board_list = transform_board_into_list_of_lists(board)
     board_to_find_list = transform_board_into_list_of_lists(board_to_find)
 
-    find_position_on_board(board_list, board_to_find_list)
+    if 'brute-force' in options:
+        board_rows = transform_board_into_list_of_lists(board)
+        matches = iter_pattern_matches_brute_force(board_rows, board_to_find_list)
+    elif 'numpy' in options:
+        board_rows = read_board_rows(board)
+        matches = iter_pattern_matches_numpy(board_rows, board_to_find_list)
+    elif 'parallel' in options:
+        workers = get_positive_int_option(options, 'workers', os.cpu_count() or 1)
+        if workers is None:
+            return
+        board_rows = None  # Lu seulement pour superposer le motif trouvé
+        first_only = 'all' not in options and 'count' not in options
+        matches = iter_pattern_matches_parallel(board, board_to_find_list, workers, first_only)
+    elif 'index' in options and (board_index := get_board_index(board)) is not None:
+        board_rows = board_index.rows
+        matches = iter_pattern_matches_indexed(board_index, board_to_find_list)
+    else:
+        board_rows = read_board_rows(board)
+        matches = iter_pattern_matches(board_rows, board_to_find_list)
+
+    if 'count' in options:
+        display_match_count(sum(1 for _ in matches))
+    elif 'all' in options:
+        display_all_matches(matches)
+    else:
+        position = next(matches, None)
+        if board_rows is None and position is not None:
+            board_rows = read_board_rows(board)
+        display_match(board_rows, board_to_find_list, position)
+
+
+def search_multiple_patterns(arguments: list[str], options: dict[str, str]) -> None:
+    '''
+    Cherche plusieurs motifs dans un même tableau en une seule lecture (option --multi).
+    Les arguments sont le tableau puis des fichiers ou dossiers de motifs.
+    '''
+    if not are_compatible_options(options, 'multi', MULTI_INCOMPATIBLE_OPTIONS):
+        return
+
+    if not is_valid_multi_length(arguments):
+        return
+
+    if not is_valid_file(arguments[:1]) or not are_valid_pattern_sources(arguments[1:]):
+        return
+
+    board_rows = read_board_rows(Path(arguments[0]))
+    pattern_files = collect_pattern_files(arguments[1:])
+    patterns = [transform_board_into_list_of_lists(pattern_file) for pattern_file in pattern_files]
+
+    first_only = 'all' not in options and 'count' not in options
+    matches = [[] for _ in patterns]
+    for index, x, y in iter_multi_pattern_matches(board_rows, patterns, first_only):
+        matches[index].append((x, y))
+
+    display_multi_pattern_results(pattern_files, matches, options)
 
 
 # Affichage :
-display_coordonates_and_pattern()
\ No newline at end of file
+
+def display_match(board_rows: list[str], board_to_find: list[list[str]], position: Optional[tuple[int, int]]) -> None:
+    
+    '''Affiche la position trouvée et le motif superposé au tableau, ou "Introuvable".'''
+    
+    if position is None:
+        print("Introuvable")
+        return
+    x, y = position
+    print(f"Trouvé !\nCoordonnées : {x},{y}")
+    display_overlay_board(board_rows, board_to_find, x, y)
+
+def display_all_matches(matches: Iterator[tuple[int, int]]) -> None:
+    
+    '''Affiche chaque position "x,y" dès qu'elle est trouvée, ou "Introuvable".'''
+    
+    found = False
+    for x, y in matches:
+        print(f"{x},{y}")
+        found = True
+    if not found:
+        print("Introuvable")
+
+def display_match_count(count: int) -> None:
+    
+    '''Affiche le nombre d'occurrences du motif, sans superposition.'''
+    
+    print(f"Occurrences : {count}")
+
+def display_multi_pattern_results(pattern_files: list[Path], matches: list[list[tuple[int, int]]],
+                                  options: dict[str, str]) -> None:
+    
+    '''Affiche, pour chaque motif, son nombre d'occurrences, toutes ses positions ou la première.'''
+    
+    for pattern_file, positions in zip(pattern_files, matches):
+        if 'count' in options:
+            print(f"{pattern_file} : Occurrences : {len(positions)}")
+        elif not positions:
+            print(f"{pattern_file} : Introuvable")
+        else:
+            for x, y in positions if 'all' in options else positions[:1]:
+                print(f"{pattern_file} : {x},{y}")
+
+if __name__ == "__main__":
+    display_coordonates_and_pattern()
@@ -1,39 +1,64 @@
+import os
+import random
+import sqlite3
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from math import isqrt
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Iterator, Optional, TextIO, Tuple, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel, le mode --numpy revient au moteur pur Python
+    np = None
 
 ############################# Fonctions utilitaires ############################
+def split_cells(line: str) -> List[str]:
+    """Découpe une ligne en cases : un caractère par case, ou des valeurs séparées par des espaces."""
+    if any(char.isspace() for char in line.strip()):
+        return line.split()
+    return list(line)
+
 def parse_grid(lines_of_sudoku: List[str]) -> List[List[int]]:
     """Convertit le contenu du fichier en grille de Sudoku."""
     grid = []
     for line in lines_of_sudoku:
         row = []
-        for char in line:
-            if char == '.':
+        for cell in split_cells(line):
+            if cell == '.':
                 row.append(0)  # 0 représente une case vide
             else:
-                row.append(int(char))
+                row.append(int(cell))
         grid.append(row)
     return grid
 
+def get_box_size(grid: List[List[int]]) -> int:
+    """Renvoie la taille d'un carré : 3 pour une grille 9x9, 4 pour 16x16..."""
+    return isqrt(len(grid))
+
 def check_line(grid: List[List[int]], row: int, value: int) -> bool:
     """Vérifie si une valeur peut être placée dans une ligne."""
     return value not in grid[row]
 
 def check_column(grid: List[List[int]], col: int, value: int) -> bool:
     """Vérifie si une valeur peut être placée dans une colonne."""
-    for row in range(9):
+    for row in range(len(grid)):
         if grid[row][col] == value:
             return False
     return True
 
 def check_box(grid: List[List[int]], row: int, col: int, value: int) -> bool:
-    """Vérifie si une valeur peut être placée dans le carré 3x3."""
-    start_row = (row // 3) * 3
-    start_col = (col // 3) * 3
+    """Vérifie si une valeur peut être placée dans le carré (3x3 pour une grille 9x9)."""
+    box_size = get_box_size(grid)
+    start_row = (row // box_size) * box_size
+    start_col = (col // box_size) * box_size
     
-    for i in range(start_row, start_row + 3):
-        for j in range(start_col, start_col + 3):
+    for i in range(start_row, start_row + box_size):
+        for j in range(start_col, start_col + box_size):
             if grid[i][j] == value:
                 return False
     return True
@@ -46,8 +71,8 @@ def is_valid_move(grid: List[List[int]], row: int, col: int, value: int) -> bool
 
 def find_empty_cell(grid: List[List[int]]) -> Tuple[Optional[int], Optional[int]]:
     """Trouve la première case vide dans la grille."""
-    for row in range(9):
-        for col in range(9):
+    for row in range(len(grid)):
+        for col in range(len(grid)):
             if grid[row][col] == 0:
                 return row, col
     return None, None
@@ -60,8 +85,8 @@ def solve_sudoku(grid: List[List[int]]) -> bool:
     if row is None:
         return True
     
-    # Essayer les chiffres de 1 à 9
-    for num in range(1, 10):
+    # Essayer les valeurs de 1 à N
+    for num in range(1, len(grid) + 1):
         if is_valid_move(grid, row, col, num):
             grid[row][col] = num
             
@@ -74,7 +99,969 @@ def solve_sudoku(grid: List[List[int]]) -> bool:
     
     return False
 
+def iter_solutions_backtracking(grid: List[List[int]]) -> Iterator[List[List[int]]]:
+    """Énumère les solutions dans l'ordre de solve_sudoku, sans récursion.
+
+    Les cases vides sont remplies dans l'ordre de lecture ; `values` garde la
+    dernière valeur essayée à chaque profondeur, ce qui tient lieu de pile.
+    """
+    grid = [row[:] for row in grid]
+    size = len(grid)
+    empty_cells = [(row, col) for row in range(size) for col in range(size) if grid[row][col] == 0]
+    if not empty_cells:
+        yield grid
+        return
+    values = [0] * len(empty_cells)
+    depth = 0
+    while depth >= 0:
+        row, col = empty_cells[depth]
+        grid[row][col] = 0
+        num = values[depth] + 1
+        while num <= size and not is_valid_move(grid, row, col, num):
+            num += 1
+        if num > size:
+            # Plus de valeur possible : on revient à la case précédente
+            values[depth] = 0
+            depth -= 1
+            continue
+        values[depth] = num
+        grid[row][col] = num
+        if depth + 1 == len(empty_cells):
+            yield [line[:] for line in grid]
+        else:
+            depth += 1
+
+######################## Moteur par propagation (bitmasks) ########################
+# Chaque valeur v est représentée par le bit 1 << (v - 1) ; une case vide vaut 0.
+class SudokuLayout:
+    """Tables précalculées d'une grille N x N (cases numérotées ligne par ligne)."""
+
+    def __init__(self, size: int):
+        box_size = isqrt(size)
+        self.size = size
+        self.cell_count = size * size
+        self.all_digits = (1 << size) - 1
+        self.cell_rows = [cell // size for cell in range(self.cell_count)]
+        self.cell_cols = [cell % size for cell in range(self.cell_count)]
+        self.cell_boxes = [(row // box_size) * box_size + col // box_size
+                           for row, col in zip(self.cell_rows, self.cell_cols)]
+        self.units = ([[row * size + col for col in range(size)] for row in range(size)]
+                      + [[row * size + col for row in range(size)] for col in range(size)]
+                      + [[cell for cell in range(self.cell_count) if self.cell_boxes[cell] == box]
+                         for box in range(size)])
+        self.peers = [sorted(set(self.units[row] + self.units[size + col] + self.units[2 * size + box]) - {cell})
+                      for cell, (row, col, box) in enumerate(zip(self.cell_rows, self.cell_cols, self.cell_boxes))]
+        # Intersections carré/ligne et carré/colonne : (cases communes, reste de la ligne, reste du carré),
+        # regroupées par ligne (ou colonne) et par carré (avec la même orientation)
+        self.segments = []
+        self.line_segments = []
+        box_segments = {}
+        for line_index, line in enumerate(self.units[:2 * size]):
+            self.line_segments.append([])
+            for box in range(size):
+                box_cells = self.units[2 * size + box]
+                common = [cell for cell in line if cell in box_cells]
+                if common:
+                    self.line_segments[-1].append(len(self.segments))
+                    box_segments.setdefault((box, line_index < size), []).append(len(self.segments))
+                    self.segments.append((common, [cell for cell in line if cell not in common],
+                                          [cell for cell in box_cells if cell not in common]))
+        self.box_segments = list(box_segments.values())
+
+RESTART_NODE_LIMIT = 100  # nœuds de la première recherche, puis +50 % à chaque relance
+DLX_RESTART_NODE_LIMIT = 1000  # idem pour Dancing Links, dont les nœuds coûtent moins cher
+
+@lru_cache(maxsize=None)
+def get_layout(size: int) -> SudokuLayout:
+    """Renvoie (et garde en mémoire) les tables d'une grille de taille donnée."""
+    return SudokuLayout(size)
+
+# Masques des cases, des lignes, des colonnes et des carrés, puis valeurs exclues de chaque case
+SudokuState = Tuple[List[int], List[int], List[int], List[int], List[int]]
+
+def build_state(grid: List[List[int]]) -> Optional[SudokuState]:
+    """Construit les masques lignes/colonnes/carrés ; None si les valeurs données se contredisent."""
+    layout = get_layout(len(grid))
+    size = layout.size
+    cells = [0] * layout.cell_count
+    rows, cols, boxes = [0] * size, [0] * size, [0] * size
+    for cell in range(layout.cell_count):
+        value = grid[cell // size][cell % size]
+        if value == 0:
+            continue
+        bit = 1 << (value - 1)
+        row, col, box = layout.cell_rows[cell], layout.cell_cols[cell], layout.cell_boxes[cell]
+        if (rows[row] | cols[col] | boxes[box]) & bit:
+            return None
+        place_digit(layout, (cells, rows, cols, boxes, []), cell, bit)
+    return cells, rows, cols, boxes, [0] * layout.cell_count
+
+def place_digit(layout: SudokuLayout, state: SudokuState, cell: int, bit: int) -> None:
+    """Place une valeur (sous forme de bit) dans une case et met à jour les masques."""
+    cells, rows, cols, boxes, _ = state
+    cells[cell] = bit
+    rows[layout.cell_rows[cell]] |= bit
+    cols[layout.cell_cols[cell]] |= bit
+    boxes[layout.cell_boxes[cell]] |= bit
+
+def get_candidates(layout: SudokuLayout, state: SudokuState, cell: int) -> int:
+    """Renvoie le masque des valeurs encore possibles pour une case vide."""
+    _, rows, cols, boxes, excluded = state
+    return layout.all_digits & ~(rows[layout.cell_rows[cell]] | cols[layout.cell_cols[cell]]
+                                 | boxes[layout.cell_boxes[cell]] | excluded[cell])
+
+def propagate(layout: SudokuLayout, state: SudokuState, weights: Optional[List[int]] = None) -> bool:
+    """Remplit les singletons nus et cachés jusqu'au point fixe, puis exclut les
+    candidats verrouillés tant que cela en fait apparaître de nouveaux.
+
+    Les candidats de chaque case sont calculés une fois, puis tenus à jour à
+    chaque valeur placée en les retirant des cases voisines.
+
+    Renvoie False dès qu'une case n'a plus de candidat ou qu'une valeur ne
+    peut plus être placée dans une ligne, une colonne ou un carré ; le poids
+    des unités en cause est alors augmenté, si `weights` est donné.
+    """
+    cells, rows, cols, boxes, excluded = state
+    all_digits, peers, segments = layout.all_digits, layout.peers, layout.segments
+    candidates = [0 if cells[cell] else all_digits & ~(rows[row] | cols[col] | boxes[box] | excluded[cell])
+                  for cell, row, col, box in zip(range(layout.cell_count), layout.cell_rows,
+                                                 layout.cell_cols, layout.cell_boxes)]
+    singles = [cell for cell, mask in enumerate(candidates) if not cells[cell] and not mask & (mask - 1)]
+    while True:
+        # Singletons nus : une case qui n'a plus qu'un seul candidat
+        while singles:
+            cell = singles.pop()
+            if cells[cell]:
+                continue
+            bit = candidates[cell]
+            if not bit:
+                if weights is not None:
+                    size = layout.size
+                    weights[layout.cell_rows[cell]] += 1
+                    weights[size + layout.cell_cols[cell]] += 1
+                    weights[2 * size + layout.cell_boxes[cell]] += 1
+                return False
+            place_digit(layout, state, cell, bit)
+            candidates[cell] = 0
+            for peer in peers[cell]:
+                mask = candidates[peer]
+                if mask & bit:
+                    mask ^= bit
+                    candidates[peer] = mask
+                    if not mask & (mask - 1):
+                        singles.append(peer)
+        # Singletons cachés : une valeur qui n'a plus qu'une place dans une unité
+        for unit_index, (unit, placed) in enumerate(zip(layout.units, rows + cols + boxes)):
+            seen_once = seen_twice = 0
+            for cell in unit:
+                mask = candidates[cell]
+                seen_twice |= seen_once & mask
+                seen_once |= mask
+            if seen_once | placed != all_digits:
+                if weights is not None:
+                    weights[unit_index] += 1
+                return False
+            hidden = seen_once & ~seen_twice
+            if not hidden:
+                continue
+            # Deux singletons cachés ne peuvent pas viser la même case
+            for cell in unit:
+                bit = candidates[cell] & hidden
+                if bit:
+                    if bit & (bit - 1):
+                        if weights is not None:
+                            weights[unit_index] += 1
+                        return False
+                    candidates[cell] = bit
+                    singles.append(cell)
+        if singles:
+            continue
+        # Candidats verrouillés : une valeur qui, dans un carré, ne peut aller que dans son
+        # intersection avec une ligne (ou une colonne) est exclue du reste de cette ligne,
+        # et inversement
+        segment_candidates = []
+        for common, _, _ in segments:
+            inside = 0
+            for cell in common:
+                inside |= candidates[cell]
+            segment_candidates.append(inside)
+        progress = False
+        for groups, rest_index in ((layout.box_segments, 1), (layout.line_segments, 2)):
+            for group in groups:
+                seen_once = seen_twice = 0
+                for index in group:
+                    seen_twice |= seen_once & segment_candidates[index]
+                    seen_once |= segment_candidates[index]
+                for index in group:
+                    locked = segment_candidates[index] & ~seen_twice
+                    if not locked:
+                        continue
+                    for cell in segments[index][rest_index]:
+                        mask = candidates[cell]
+                        if mask & locked:
+                            excluded[cell] |= locked
+                            mask &= ~locked
+                            candidates[cell] = mask
+                            progress = True
+                            if not mask & (mask - 1):
+                                singles.append(cell)
+        if not progress:
+            return True
+
+def find_most_constrained_cell(layout: SudokuLayout, state: SudokuState,
+                               rng: Optional[random.Random] = None,
+                               weights: Optional[List[int]] = None) -> Tuple[int, int]:
+    """Trouve la case vide qui a le moins de candidats (heuristique MRV).
+
+    Avec `weights` (poids de chaque ligne, colonne puis carré), c'est le
+    nombre de candidats divisé par le poids des unités de la case qui compte
+    (heuristique dom/wdeg) : les cases des unités souvent en échec passent
+    devant. Avec rng, une case est tirée au hasard parmi les ex æquo ; sinon
+    c'est la première. Renvoie (-1, 0) si la grille est complète.
+    """
+    cells = state[0]
+    size = layout.size
+    best_cell, best_candidates, best_count, best_weight = -1, 0, size + 1, 1
+    ties = 0
+    for cell in range(layout.cell_count):
+        if cells[cell]:
+            continue
+        candidates = get_candidates(layout, state, cell)
+        count = bin(candidates).count('1')
+        weight = 1
+        if weights is not None:
+            weight = (weights[layout.cell_rows[cell]] + weights[size + layout.cell_cols[cell]]
+                      + weights[2 * size + layout.cell_boxes[cell]])
+        # count / weight < best_count / best_weight, sans division
+        if count * best_weight < best_count * weight:
+            best_cell, best_candidates, best_count, best_weight = cell, candidates, count, weight
+            ties = 1
+            if count <= 2 and rng is None and weights is None:
+                break
+        elif count * best_weight == best_count * weight and rng is not None:
+            ties += 1
+            if rng.randrange(ties) == 0:
+                best_cell, best_candidates = cell, candidates
+    return best_cell, best_candidates
+
+def find_first_empty_cell(layout: SudokuLayout, state: SudokuState) -> Tuple[int, int]:
+    """Trouve la première case vide en lecture ligne par ligne, comme find_empty_cell.
+
+    Renvoie (case, candidats), ou (-1, 0) si la grille est complète.
+    """
+    cells = state[0]
+    for cell in range(layout.cell_count):
+        if not cells[cell]:
+            return cell, get_candidates(layout, state, cell)
+    return -1, 0
+
+def branch(layout: SudokuLayout, state: SudokuState, cell: int, bits: List[int]) -> List[SudokuState]:
+    """Renvoie un état enfant par valeur de `bits`, dans le même ordre.
+
+    Le dernier reprend l'état courant, les autres en reçoivent une copie.
+    """
+    cells, rows, cols, boxes, excluded = state
+    children = [(cells[:], rows[:], cols[:], boxes[:], excluded[:]) for _ in bits[:-1]]
+    children.append(state)
+    for bit, child in zip(bits, children):
+        place_digit(layout, child, cell, bit)
+    return children
+
+def split_bits(mask: int) -> List[int]:
+    """Découpe un masque en ses bits, du plus petit au plus grand."""
+    bits = []
+    while mask:
+        bits.append(mask & -mask)
+        mask ^= bits[-1]
+    return bits
+
+def state_to_grid(layout: SudokuLayout, state: SudokuState) -> List[List[int]]:
+    """Reconstruit la grille d'un état complet."""
+    size = layout.size
+    return [[bit.bit_length() for bit in state[0][start:start + size]]
+            for start in range(0, layout.cell_count, size)]
+
+def iter_solutions(grid: List[List[int]], limit: Optional[int] = None) -> Iterator[List[List[int]]]:
+    """Énumère les solutions de la grille, au plus `limit` si elle est donnée.
+
+    La recherche n'est pas récursive : une pile explicite garde les états à
+    explorer. Chaque état est propagé, puis ses enfants (une valeur par
+    candidat de la case la plus contrainte) sont empilés de sorte que la
+    plus petite valeur soit explorée en premier. Avec limit=2, un test
+    d'unicité s'arrête dès la deuxième solution.
+    """
+    state = build_state(grid)
+    if state is None:
+        return
+    layout = get_layout(len(grid))
+    stack = [state]
+    found = 0
+    while stack:
+        state = stack.pop()
+        if not propagate(layout, state):
+            continue
+        cell, candidates = find_most_constrained_cell(layout, state)
+        if cell < 0:
+            yield state_to_grid(layout, state)
+            found += 1
+            if found == limit:
+                return
+            continue
+        stack.extend(reversed(branch(layout, state, cell, split_bits(candidates))))
+
+def search_solution(layout: SudokuLayout, state: SudokuState, node_limit: Optional[int],
+                    rng: Optional[random.Random] = None,
+                    weights: Optional[List[int]] = None,
+                    row_major: bool = False) -> Tuple[Optional[SudokuState], bool]:
+    """Cherche une solution en profondeur en visitant au plus `node_limit` états.
+
+    Avec row_major, la case choisie est la première case vide et les valeurs
+    sont essayées dans l'ordre croissant : la propagation ne retirant que des
+    valeurs impossibles, la solution trouvée est celle de solve_sudoku. Sinon,
+    sans rng ni weights, l'ordre est celui de iter_solutions ; avec, la case
+    est choisie comme dans find_most_constrained_cell et l'ordre des valeurs
+    est tiré au hasard. Renvoie (état résolu ou None, True si toute la
+    recherche a été faite sans atteindre la limite).
+    """
+    stack = [state]
+    nodes = 0
+    while stack:
+        if nodes == node_limit:
+            return None, False
+        nodes += 1
+        state = stack.pop()
+        if not propagate(layout, state, weights):
+            continue
+        if row_major:
+            cell, candidates = find_first_empty_cell(layout, state)
+        else:
+            cell, candidates = find_most_constrained_cell(layout, state, rng, weights)
+        if cell < 0:
+            return state, True
+        bits = split_bits(candidates)
+        if rng is not None:
+            rng.shuffle(bits)
+        stack.extend(reversed(branch(layout, state, cell, bits)))
+    return None, True
+
+def solve_sudoku_propagation(grid: List[List[int]]) -> bool:
+    """Résout le Sudoku par propagation de contraintes sur des bitmasks et MRV.
+
+    La recherche est relancée avec une limite de nœuds qui grandit à chaque
+    fois. La première suit l'ordre de solve_sudoku (première case vide,
+    valeurs croissantes) : sur une grille à plusieurs solutions, c'est la même
+    qui est rendue. Jusqu'à 9x9 elle n'a pas de limite, il n'y a donc pas de
+    relance. Les suivantes tirent l'ordre des valeurs au hasard (graine fixe)
+    et choisissent les cases avec les poids des unités en échec, qui
+    s'accumulent d'une relance à l'autre. Sur les grandes grilles, un mauvais
+    choix fait tôt ne bloque plus la recherche dans un sous-arbre sans solution.
+    """
+    state = build_state(grid)
+    if state is None:
+        return False
+    layout = get_layout(len(grid))
+    rng = weights = None
+    node_limit = RESTART_NODE_LIMIT
+    while True:
+        solution, complete = search_solution(layout, tuple(values[:] for values in state),
+                                             None if rng is None and layout.size <= 9 else node_limit,
+                                             rng, weights, row_major=rng is None)
+        if solution is not None:
+            grid[:] = state_to_grid(layout, solution)
+            return True
+        if complete:
+            return False
+        if rng is None:
+            rng, weights = random.Random(0), [1] * len(layout.units)
+        node_limit += node_limit // 2
+
+#################### Moteur Dancing Links (Algorithme X de Knuth) ####################
+class DancingLinks:
+    """Matrice creuse de couverture exacte, stockée dans des listes de liens.
+
+    Le nœud 0 est la racine, les nœuds 1..n sont les en-têtes de colonnes et
+    les nœuds suivants sont les 1 de la matrice.
+    """
+
+    def __init__(self, column_count: int):
+        self.left = [column - 1 for column in range(column_count + 1)]
+        self.left[0] = column_count
+        self.right = [column + 1 for column in range(column_count + 1)]
+        self.right[column_count] = 0
+        self.up = list(range(column_count + 1))
+        self.down = list(range(column_count + 1))
+        self.column = list(range(column_count + 1))
+        self.row_of_node = [-1] * (column_count + 1)
+        self.size = [0] * (column_count + 1)
+        self.nodes = 0  # appels de iter_exact_covers, pour la limite de nœuds
+        self.selected_rows = []  # lignes retenues d'office avec select_row
+
+    def add_row(self, row_id: int, columns: List[int]) -> int:
+        """Ajoute une ligne de la matrice, avec un 1 dans chacune des colonnes (1..n).
+
+        Renvoie le premier nœud de la ligne.
+        """
+        first = len(self.column)
+        for offset, column in enumerate(columns):
+            node = first + offset
+            self.left.append(first + offset - 1 if offset else first + len(columns) - 1)
+            self.right.append(node + 1 if offset < len(columns) - 1 else first)
+            self.up.append(self.up[column])
+            self.down.append(column)
+            self.down[self.up[column]] = node
+            self.up[column] = node
+            self.column.append(column)
+            self.row_of_node.append(row_id)
+            self.size[column] += 1
+        return first
+
+    def select_row(self, node: int) -> None:
+        """Retient une ligne hors recherche : couvre chacune de ses colonnes."""
+        self.selected_rows.append(self.row_of_node[node])
+        self.cover(self.column[node])
+        other = self.right[node]
+        while other != node:
+            self.cover(self.column[other])
+            other = self.right[other]
+
+    def cover(self, column: int) -> None:
+        """Retire une colonne et toutes les lignes qui la touchent."""
+        left, right, up, down = self.left, self.right, self.up, self.down
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+        row = down[column]
+        while row != column:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                self.size[self.column[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def uncover(self, column: int) -> None:
+        """Annule cover(column), dans l'ordre inverse."""
+        left, right, up, down = self.left, self.right, self.up, self.down
+        row = up[column]
+        while row != column:
+            node = left[row]
+            while node != row:
+                self.size[self.column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[column]] = column
+        left[right[column]] = column
+
+    def choose_column(self, rng: Optional[random.Random] = None) -> int:
+        """Choisit la colonne qui a le moins de lignes (heuristique S de Knuth).
+
+        Avec rng, une colonne est tirée au hasard parmi les ex æquo.
+        """
+        best_column, best_size = 0, -1
+        ties = 0
+        column = self.right[0]
+        while column != 0:
+            if best_size < 0 or self.size[column] < best_size:
+                best_column, best_size = column, self.size[column]
+                ties = 1
+                if best_size == 0 or (best_size == 1 and rng is None):
+                    break
+            elif self.size[column] == best_size and rng is not None:
+                ties += 1
+                if rng.randrange(ties) == 0:
+                    best_column = column
+            column = self.right[column]
+        return best_column
+
+    def iter_exact_covers(self, chosen: Optional[List[int]] = None, rng: Optional[random.Random] = None,
+                          node_limit: Optional[int] = None) -> Iterator[List[int]]:
+        """Énumère les couvertures exactes, sous forme de listes d'identifiants de lignes.
+
+        Avec rng, les colonnes ex æquo et l'ordre des lignes sont tirés au
+        hasard. Une fois `node_limit` appels faits, la recherche s'arrête et
+        la matrice est rendue intacte.
+        """
+        if node_limit is not None and self.nodes >= node_limit:
+            return
+        self.nodes += 1
+        if chosen is None:
+            chosen = []
+        if self.right[0] == 0:
+            yield chosen[:]
+            return
+        column = self.choose_column(rng)
+        if self.size[column] == 0:
+            return
+        self.cover(column)
+        rows = []
+        row = self.down[column]
+        while row != column:
+            rows.append(row)
+            row = self.down[row]
+        if rng is not None:
+            rng.shuffle(rows)
+        for row in rows:
+            chosen.append(self.row_of_node[row])
+            node = self.right[row]
+            while node != row:
+                self.cover(self.column[node])
+                node = self.right[node]
+            yield from self.iter_exact_covers(chosen, rng, node_limit)
+            node = self.left[row]
+            while node != row:
+                self.uncover(self.column[node])
+                node = self.left[node]
+            chosen.pop()
+        self.uncover(column)
+
+def build_exact_cover(grid: List[List[int]]) -> Optional[DancingLinks]:
+    """Traduit la grille en couverture exacte : 4 x N² contraintes, une ligne par (case, valeur).
+
+    Contraintes : case remplie, valeur dans la ligne, dans la colonne, dans le carré.
+    La grille est d'abord propagée : les lignes des valeurs données ou déduites
+    sont retenues d'office et les valeurs exclues n'ont pas de ligne. Renvoie
+    None si la grille se contredit.
+    """
+    state = build_state(grid)
+    layout = get_layout(len(grid))
+    if state is None or not propagate(layout, state):
+        return None
+    size, cell_count = layout.size, layout.cell_count
+    cells = state[0]
+    matrix = DancingLinks(4 * cell_count)
+    given_nodes = []
+    for cell in range(cell_count):
+        row, col, box = layout.cell_rows[cell], layout.cell_cols[cell], layout.cell_boxes[cell]
+        candidates = cells[cell] or get_candidates(layout, state, cell)
+        for digit in range(size):
+            if candidates & (1 << digit):
+                node = matrix.add_row(cell * size + digit,
+                                      [1 + cell,
+                                       1 + cell_count + row * size + digit,
+                                       1 + 2 * cell_count + col * size + digit,
+                                       1 + 3 * cell_count + box * size + digit])
+                if cells[cell]:
+                    given_nodes.append(node)
+    for node in given_nodes:
+        matrix.select_row(node)
+    return matrix
+
+def cover_to_grid(grid: List[List[int]], cover: List[int]) -> List[List[int]]:
+    """Remplit une copie de la grille avec les lignes (case, valeur) d'une couverture exacte."""
+    size = len(grid)
+    solution = [row[:] for row in grid]
+    for row_id in cover:
+        cell, digit = divmod(row_id, size)
+        solution[cell // size][cell % size] = digit + 1
+    return solution
+
+def iter_solutions_dlx(grid: List[List[int]]) -> Iterator[List[List[int]]]:
+    """Énumère les solutions de la grille avec Dancing Links."""
+    matrix = build_exact_cover(grid)
+    if matrix is None:
+        return
+    for cover in matrix.iter_exact_covers():
+        yield cover_to_grid(grid, matrix.selected_rows + cover)
+
+def solve_sudoku_dlx(grid: List[List[int]]) -> bool:
+    """Résout le Sudoku comme un problème de couverture exacte (Dancing Links).
+
+    Comme pour solve_sudoku_propagation, la recherche est relancée avec une
+    limite de nœuds qui grandit : la première suit l'ordre de
+    iter_solutions_dlx, les suivantes tirent au hasard (graine fixe) les
+    colonnes ex æquo et l'ordre des lignes.
+    """
+    matrix = build_exact_cover(grid)
+    if matrix is None:
+        return False
+    rng = None
+    node_limit = DLX_RESTART_NODE_LIMIT
+    while True:
+        matrix.nodes = 0
+        cover = next(matrix.iter_exact_covers(rng=rng, node_limit=node_limit), None)
+        if cover is not None:
+            grid[:] = cover_to_grid(grid, matrix.selected_rows + cover)
+            return True
+        if matrix.nodes < node_limit:
+            return False
+        rng = rng or random.Random(0)
+        node_limit += node_limit // 2
+
+def count_solutions(grid: List[List[int]], backend: str, limit: Optional[int] = None) -> int:
+    """Compte les solutions de la grille avec le moteur choisi (en s'arrêtant à `limit`)."""
+    return sum(1 for _ in islice(SOLUTION_ITERATORS[backend](grid), limit))
+
+# Au-delà de 9x9, 'propagation' est le moteur à utiliser pour trouver une solution :
+# sur les grilles 25x25 les plus difficiles (autour de 40 à 50 % de cases données),
+# 'dlx' peut dépasser la minute, il sert surtout à compter et énumérer les solutions.
+SOLVING_BACKENDS = {
+    'propagation': solve_sudoku_propagation,
+    'backtracking': solve_sudoku,
+    'dlx': solve_sudoku_dlx,
+}
+# Énumération des solutions (--limit, --unique, --count), dans l'ordre de chaque moteur
+SOLUTION_ITERATORS = {
+    'propagation': iter_solutions,
+    'backtracking': iter_solutions_backtracking,
+    'dlx': iter_solutions_dlx,
+}
+# Sur une grille à plusieurs solutions, 'propagation' rend la même que 'backtracking'
+# (voir solve_sudoku_propagation), sauf au-delà de 9x9 si sa première recherche
+# dépasse RESTART_NODE_LIMIT nœuds.
+DEFAULT_BACKEND = 'propagation'
+COUNT_DEFAULT_BACKEND = 'dlx'
+
+###################### Cache des solutions (forme canonique) ######################
+# Deux grilles équivalentes (valeurs renommées, lignes ou colonnes permutées
+# dans une bande, bandes ou piles permutées, grille transposée) ont la même
+# forme canonique : la plus petite, dans l'ordre lexicographique, de toutes
+# leurs transformées. Les valeurs y sont renommées a, b, c... dans l'ordre
+# d'apparition et les cases vides, notées '.', passent après les valeurs.
+CANONICAL_STATE_LIMIT = 20000
+
+SymmetryTransform = Tuple[bool, List[int], List[int], Dict[int, int]]
+
+def label_row(row: List[int], cols: List[int], labels: Dict[int, int],
+              empty_label: int) -> Tuple[List[int], Dict[int, int]]:
+    """Renomme une ligne lue dans l'ordre `cols` ; les nouvelles valeurs reçoivent le label suivant."""
+    values = []
+    for col in cols:
+        digit = row[col]
+        if not digit:
+            values.append(empty_label)
+            continue
+        if digit not in labels:
+            labels = {**labels, digit: len(labels)}
+        values.append(labels[digit])
+    return values, labels
+
+def canonicalize(grid: List[List[int]]) -> Optional[Tuple[str, SymmetryTransform]]:
+    """Calcule la forme canonique de la grille et la transformation qui y mène.
+
+    La forme est construite case par case, ligne après ligne. À chaque
+    étape, seules les transformations partielles qui donnent le plus petit
+    préfixe sont gardées. Renvoie None si elles restent trop nombreuses
+    (grille très symétrique ou presque vide).
+    """
+    size = len(grid)
+    box_size = isqrt(size)
+    transposed_grid = [list(column) for column in zip(*grid)]
+    variants = ((False, grid), (True, transposed_grid))
+    # Première ligne : on choisit la ligne source puis les colonnes une à une
+    states = [(transposed, variant, row, [], {}) for transposed, variant in variants
+              for row in range(size)]
+    canonical = []
+    for position in range(size):
+        best_value = size + 1
+        next_states = []
+        for transposed, variant, row, cols, labels in states:
+            if position % box_size == 0:
+                used_stacks = {col // box_size for col in cols}
+                choices = [col for col in range(size) if col // box_size not in used_stacks]
+            else:
+                first_col = (cols[-1] // box_size) * box_size
+                choices = [col for col in range(first_col, first_col + box_size) if col not in cols]
+            for col in choices:
+                digit = variant[row][col]
+                value = labels.get(digit, len(labels)) if digit else size
+                if value > best_value:
+                    continue
+                if value < best_value:
+                    best_value = value
+                    next_states = []
+                new_labels = labels if not digit or digit in labels else {**labels, digit: value}
+                next_states.append((transposed, variant, row, cols + [col], new_labels))
+        if len(next_states) > CANONICAL_STATE_LIMIT:
+            return None
+        states = next_states
+        canonical.append(best_value)
+
+    # Lignes suivantes : les colonnes sont fixées, on choisit la ligne source
+    states = [(transposed, variant, [row], cols, labels)
+              for transposed, variant, row, cols, labels in states]
+    for position in range(1, size):
+        best_values = None
+        next_states = []
+        for transposed, variant, rows, cols, labels in states:
+            if position % box_size == 0:
+                used_bands = {row // box_size for row in rows}
+                choices = [row for row in range(size) if row // box_size not in used_bands]
+            else:
+                first_row = (rows[-1] // box_size) * box_size
+                choices = [row for row in range(first_row, first_row + box_size) if row not in rows]
+            for row in choices:
+                values, new_labels = label_row(variant[row], cols, labels, size)
+                if best_values is not None and values > best_values:
+                    continue
+                if best_values is None or values < best_values:
+                    best_values = values
+                    next_states = []
+                next_states.append((transposed, variant, rows + [row], cols, new_labels))
+        if len(next_states) > CANONICAL_STATE_LIMIT:
+            return None
+        states = next_states
+        canonical.extend(best_values)
+
+    transposed, _, rows, cols, labels = states[0]
+    key = ''.join('.' if value == size else chr(ord('a') + value) for value in canonical)
+    return key, (transposed, rows, cols, labels)
+
+def apply_symmetry(solution: List[List[int]], transform: SymmetryTransform) -> str:
+    """Transforme une solution de la grille d'origine en solution de la forme canonique."""
+    transposed, rows, cols, labels = transform
+    if transposed:
+        solution = [list(column) for column in zip(*solution)]
+    size = len(solution)
+    canonical = []
+    for row in rows:
+        values, labels = label_row(solution[row], cols, labels, size)
+        canonical.extend(values)
+    return ''.join(chr(ord('a') + value) for value in canonical)
+
+def undo_symmetry(canonical: str, transform: SymmetryTransform) -> List[List[int]]:
+    """Ramène une solution de la forme canonique dans l'orientation de la grille d'origine.
+
+    Les labels absents des valeurs données correspondent aux valeurs absentes
+    de la grille, associées dans l'ordre croissant.
+    """
+    transposed, rows, cols, labels = transform
+    size = len(rows)
+    digits = {label: digit for digit, label in labels.items()}
+    missing_digits = [digit for digit in range(1, size + 1) if digit not in labels]
+    missing_labels = [label for label in range(size) if label not in digits]
+    digits.update(zip(missing_labels, missing_digits))
+    grid = [[0] * size for _ in range(size)]
+    for index, char in enumerate(canonical):
+        row, col = rows[index // size], cols[index % size]
+        if transposed:
+            row, col = col, row
+        grid[row][col] = digits[ord(char) - ord('a')]
+    return grid
+
+class SolutionCache:
+    """Cache SQLite des solutions, indexé par forme canonique, avec éviction LRU.
+
+    Une grille sans solution est enregistrée avec une solution vide.
+    """
+
+    def __init__(self, path: Path, max_entries: int):
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("CREATE TABLE IF NOT EXISTS solutions ("
+                                "puzzle TEXT PRIMARY KEY, solution TEXT NOT NULL, "
+                                "last_used INTEGER NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS solutions_by_last_used "
+                                "ON solutions (last_used)")
+
+    def lookup(self, puzzle: str) -> Optional[str]:
+        """Renvoie la solution enregistrée (et la marque comme récente), ou None."""
+        row = self.connection.execute("SELECT solution FROM solutions WHERE puzzle = ?",
+                                      (puzzle,)).fetchone()
+        if row is None:
+            return None
+        with self.connection:
+            self.connection.execute("UPDATE solutions SET last_used = ? WHERE puzzle = ?",
+                                    (time.time_ns(), puzzle))
+        return row[0]
+
+    def store(self, puzzle: str, solution: str) -> None:
+        """Enregistre une solution puis retire les entrées les moins récemment utilisées."""
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)",
+                                    (puzzle, solution, time.time_ns()))
+            self.connection.execute("DELETE FROM solutions WHERE puzzle IN ("
+                                    "SELECT puzzle FROM solutions ORDER BY last_used DESC "
+                                    "LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def close(self) -> None:
+        """Ferme la base."""
+        self.connection.close()
+
+def solve_sudoku_cached(grid: List[List[int]], backend: str, cache: SolutionCache) -> bool:
+    """Résout la grille en passant par le cache ; sans recherche si une grille équivalente y est."""
+    form = canonicalize(grid)
+    if form is None:
+        return SOLVING_BACKENDS[backend](grid)
+    key, transform = form
+    canonical_solution = cache.lookup(key)
+    if canonical_solution is not None:
+        if not canonical_solution:
+            return False
+        grid[:] = undo_symmetry(canonical_solution, transform)
+        return True
+    solved = SOLVING_BACKENDS[backend](grid)
+    cache.store(key, apply_symmetry(grid, transform) if solved else '')
+    return solved
+
+############################# Résolution par lots ############################
+# Une grille par ligne : 81 caractères lus ligne par ligne, '.' ou '0' pour une case vide.
+BATCH_CHARACTERS = set('1234567890.')
+
+def parse_puzzle_line(line: str) -> Optional[List[List[int]]]:
+    """Convertit une grille écrite sur une ligne ; None si le format est invalide."""
+    if len(line) != 81 or not BATCH_CHARACTERS.issuperset(line):
+        return None
+    return parse_grid([line[start:start + 9] for start in range(0, 81, 9)])
+
+def solve_puzzle_line(line: str, line_number: int, backend: str) -> str:
+    """Résout une grille écrite sur une ligne et renvoie la ligne à afficher."""
+    grid = parse_puzzle_line(line)
+    if grid is None:
+        return f"Erreur : ligne {line_number} : la grille doit contenir 81 chiffres ou points"
+    if not SOLVING_BACKENDS[backend](grid):
+        return f"Erreur : ligne {line_number} : ce Sudoku n'a pas de solution"
+    return ''.join(str(value) for row in grid for value in row)
+
+def solve_puzzle_chunk(first_line: int, lines: List[str], backend: str,
+                       use_numpy: bool = False) -> List[str]:
+    """Résout un paquet de lignes (exécuté dans un processus du pool)."""
+    if use_numpy and np is not None:
+        return solve_puzzle_chunk_numpy(first_line, lines, backend)
+    return [solve_puzzle_line(line, line_number, backend)
+            for line_number, line in enumerate(lines, first_line) if line]
+
+def iter_puzzle_chunks(puzzle_file: TextIO, chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Découpe le fichier en paquets de lignes, avec le numéro de leur première ligne."""
+    chunk = []
+    first_line = 1
+    for line_number, line in enumerate(puzzle_file, 1):
+        if not chunk:
+            first_line = line_number
+        chunk.append(line.strip())
+        if len(chunk) == chunk_size:
+            yield first_line, chunk
+            chunk = []
+    if chunk:
+        yield first_line, chunk
+
+def iter_batch_solutions(puzzle_file: TextIO, backend: str, workers: int,
+                         chunk_size: int, use_numpy: bool = False) -> Iterator[str]:
+    """Résout un fichier de grilles et renvoie les résultats dans l'ordre du fichier.
+
+    Au plus 2 paquets par processus sont en attente à la fois : la mémoire
+    reste constante quelle que soit la taille du fichier.
+    """
+    chunks = iter_puzzle_chunks(puzzle_file, chunk_size)
+    if workers == 1:
+        for first_line, lines in chunks:
+            yield from solve_puzzle_chunk(first_line, lines, backend, use_numpy)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for first_line, lines in chunks:
+            pending.append(executor.submit(solve_puzzle_chunk, first_line, lines, backend,
+                                           use_numpy))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+########################## Moteur NumPy (lots de grilles 9x9) ##########################
+# Un lot de N grilles est un tableau (N, 81) d'entiers 16 bits : comme pour le
+# moteur par propagation, le bit v - 1 d'une case vaut 1 si la valeur v y est
+# encore possible. C'est le tenseur booléen (N, 9, 9, 9) des candidats, compacté.
+def get_numpy_tables() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Renvoie les cases de chaque unité (27, 9), les unités de chaque case (81, 3)
+    et le nombre de bits de chaque masque de 9 bits."""
+    layout = get_layout(9)
+    unit_cells = np.array(layout.units)
+    cell_units = np.array([[row, 9 + col, 18 + box] for row, col, box
+                           in zip(layout.cell_rows, layout.cell_cols, layout.cell_boxes)])
+    bit_counts = np.array([bin(mask).count('1') for mask in range(1 << 9)], dtype=np.int8)
+    return unit_cells, cell_units, bit_counts
+
+def propagate_numpy(candidates: "np.ndarray") -> "np.ndarray":
+    """Applique les singletons nus et cachés à toutes les grilles du lot, jusqu'au point fixe.
+
+    Seules les grilles qui ont changé au tour précédent sont retraitées.
+    Modifie `candidates` et renvoie le masque (N,) des grilles contradictoires.
+    """
+    unit_cells, cell_units, bit_counts = get_numpy_tables()
+    all_digits = get_layout(9).all_digits
+    failed = np.zeros(len(candidates), dtype=bool)
+    active = np.arange(len(candidates))
+    while len(active):
+        batch = candidates[active]
+        previous = batch.copy()
+        # Singletons nus : une valeur placée disparaît des autres cases de ses unités
+        placed = np.where(bit_counts[batch] == 1, batch, 0).astype(np.uint16)
+        placed_in_units = placed[:, unit_cells]
+        placed_per_unit = np.bitwise_or.reduce(placed_in_units, axis=2)
+        duplicated = bit_counts[placed_in_units].sum(axis=2) != bit_counts[placed_per_unit]
+        blocked = np.bitwise_or.reduce(placed_per_unit[:, cell_units], axis=2)
+        batch &= ~blocked
+        batch |= placed
+        # Singletons cachés : une valeur qui n'a plus qu'une case possible dans une unité
+        unit_candidates = batch[:, unit_cells]
+        seen_once = np.zeros(unit_candidates.shape[:2], dtype=np.uint16)
+        seen_twice = np.zeros_like(seen_once)
+        for position in range(9):
+            cell_candidates = unit_candidates[:, :, position]
+            seen_twice |= seen_once & cell_candidates
+            seen_once |= cell_candidates
+        missing = seen_once != all_digits
+        singles = seen_once & ~seen_twice
+        forced = np.bitwise_or.reduce(batch[:, :, None] & singles[:, cell_units], axis=2)
+        conflicting = bit_counts[forced] > 1
+        batch = np.where(forced != 0, forced, batch)
+        empty = batch == 0
+
+        failed[active] |= (duplicated.any(axis=1) | missing.any(axis=1)
+                           | conflicting.any(axis=1) | empty.any(axis=1))
+        candidates[active] = batch
+        changed = (batch != previous).any(axis=1) & ~failed[active]
+        active = active[changed]
+    return failed
+
+def solve_puzzle_chunk_numpy(first_line: int, lines: List[str], backend: str) -> List[str]:
+    """Résout un paquet de lignes en propageant toutes les grilles d'un coup avec NumPy.
+
+    Les grilles que la propagation ne termine pas sont reprises une par une
+    par le moteur choisi, à partir des cases déjà déduites.
+    """
+    results = {}
+    puzzles = []
+    line_numbers = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line:
+            continue
+        if len(line) != 81 or not BATCH_CHARACTERS.issuperset(line):
+            results[line_number] = solve_puzzle_line(line, line_number, backend)
+        else:
+            puzzles.append(line)
+            line_numbers.append(line_number)
+
+    if puzzles:
+        codes = np.frombuffer(''.join(puzzles).encode('ascii'), dtype=np.uint8).reshape(-1, 81)
+        values = np.where(codes == ord('.'), 0, codes - ord('0')).astype(np.uint16)
+        bits = np.left_shift(1, np.maximum(values, 1) - 1, dtype=np.uint16)
+        candidates = np.where(values > 0, bits, get_layout(9).all_digits).astype(np.uint16)
+        failed = propagate_numpy(candidates)
+        _, _, bit_counts = get_numpy_tables()
+        single = bit_counts[candidates] == 1
+        solved = ~failed & single.all(axis=1)
+        digits = np.log2(np.maximum(candidates, 1)).astype(np.uint8) + 1
+        # Une ligne de texte par grille : la solution, ou les cases déjà déduites
+        texts = np.where(single, digits + ord('0'), ord('.')).astype(np.uint8)
+        for index, line_number in enumerate(line_numbers):
+            text = texts[index].tobytes().decode('ascii')
+            if failed[index]:
+                results[line_number] = f"Erreur : ligne {line_number} : ce Sudoku n'a pas de solution"
+            elif solved[index]:
+                results[line_number] = text
+            else:
+                results[line_number] = solve_puzzle_line(text, line_number, backend)
+
+    return [results[line_number] for line_number in sorted(results)]
+
 ############################# Gestion d'erreurs ############################
+KNOWN_OPTIONS = {'backend', 'count', 'batch', 'workers', 'chunk-size', 'unique', 'limit',
+                 'cache', 'cache-size', 'numpy'}
+CACHE_INCOMPATIBLE_OPTIONS = ('batch', 'count', 'unique', 'limit')
+
 def is_valid_length(arguments: List[str]) -> bool:
     """Vérifie que le bon nombre d'arguments est fourni."""
     if len(arguments) != 1:
@@ -82,6 +1069,44 @@ def is_valid_length(arguments: List[str]) -> bool:
         return False
     return True
 
+def has_known_options(options: Dict[str, str]) -> bool:
+    """Vérifie que toutes les options passées sont connues."""
+    for name in options:
+        if name not in KNOWN_OPTIONS:
+            print(f"Erreur : Option inconnue '--{name}'")
+            return False
+    return True
+
+def get_positive_int_option(options: Dict[str, str], name: str, default: int) -> Optional[int]:
+    """Lit une option entière strictement positive (ex: '--workers=4')."""
+    if name not in options:
+        return default
+    value = options[name]
+    if not value.isdigit() or int(value) == 0:
+        print(f"Erreur : L'option --{name} attend un entier strictement positif")
+        return None
+    return int(value)
+
+def is_valid_backend(backend: str) -> bool:
+    """Vérifie que le moteur de résolution demandé existe."""
+    if backend not in SOLVING_BACKENDS:
+        print(f"Erreur : Moteur inconnu '{backend}' (choix : {', '.join(SOLVING_BACKENDS)})")
+        return False
+    return True
+
+def are_valid_cache_options(options: Dict[str, str]) -> bool:
+    """Vérifie que --cache n'accompagne que la résolution simple, seule à passer par le cache."""
+    if 'cache' not in options:
+        if 'cache-size' in options:
+            print("Erreur : L'option --cache-size ne s'utilise qu'avec --cache")
+            return False
+        return True
+    for name in CACHE_INCOMPATIBLE_OPTIONS:
+        if name in options:
+            print(f"Erreur : L'option --{name} ne s'utilise pas avec --cache")
+            return False
+    return True
+
 def is_valid_file(file_name: Path) -> bool:
     """Vérifie que le fichier existe."""
     if not file_name.is_file():
@@ -90,26 +1115,29 @@ def is_valid_file(file_name: Path) -> bool:
     return True
 
 def has_correct_line_count(lines_of_sudoku: List[str]) -> bool:
-    """Vérifie que la grille contient exactement 9 lignes."""
-    if len(lines_of_sudoku) != 9:
-        print("Erreur : La grille doit contenir exactement 9 lignes")
+    """Vérifie que le nombre de lignes est un carré parfait (4, 9, 16, 25...)."""
+    box_size = isqrt(len(lines_of_sudoku))
+    if box_size < 2 or box_size * box_size != len(lines_of_sudoku):
+        print("Erreur : La grille doit contenir N lignes, N étant un carré parfait (4, 9, 16, 25...)")
         return False
     return True
 
 def has_correct_line_length(lines_of_sudoku: List[str]) -> bool:
-    """Vérifie que chaque ligne contient exactement 9 caractères."""
+    """Vérifie que chaque ligne contient autant de cases que la grille a de lignes."""
+    size = len(lines_of_sudoku)
     for i, line in enumerate(lines_of_sudoku):
-        if len(line) != 9:
-            print(f"Erreur : La ligne {i+1} ne contient pas 9 caractères")
+        if len(split_cells(line)) != size:
+            print(f"Erreur : La ligne {i+1} ne contient pas {size} cases")
             return False
     return True
 
 def has_valid_characters(lines_of_sudoku: List[str]) -> bool:
-    """Vérifie que chaque caractère est un chiffre de 1-9 ou un point."""
+    """Vérifie que chaque case est une valeur de 1 à N ou un point."""
+    valid_cells = {'.'} | {str(value) for value in range(1, len(lines_of_sudoku) + 1)}
     for line in lines_of_sudoku:
-        for char in line:
-            if char not in '123456789.':
-                print(f"Erreur : Caractère invalide '{char}' trouvé")
+        for cell in split_cells(line):
+            if cell not in valid_cells:
+                print(f"Erreur : Caractère invalide '{cell}' trouvé")
                 return False
     return True
 
@@ -118,18 +1146,48 @@ def get_arguments() -> List[str]:
     """Récupère les arguments de la ligne de commande."""
     return sys.argv[1:]
 
+def split_arguments(arguments: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Sépare les arguments positionnels des options (ex: '--backend=dlx')."""
+    positional = []
+    options = {}
+    for argument in arguments:
+        if argument.startswith('--'):
+            name, _, value = argument[2:].partition('=')
+            options[name] = value
+        else:
+            positional.append(argument)
+    return positional, options
+
 ############################# Résolution ############################
 def solve_sudoku_from_file() -> Optional[List[List[int]]]:
     """Fonction principale qui orchestre la résolution du Sudoku."""
-    arguments = get_arguments()
+    arguments, options = split_arguments(get_arguments())
+
+    if not has_known_options(options):
+        return
+
+    if not are_valid_cache_options(options):
+        return
 
     if not is_valid_length(arguments):
         return
+
+    backend = options.get('backend', DEFAULT_BACKEND)
+    if not is_valid_backend(backend):
+        return
     
     file_name = Path(arguments[0])
 
     if not is_valid_file(file_name):
         return
+
+    if 'batch' in options:
+        solve_sudoku_batch(file_name, backend, options)
+        return
+
+    if 'numpy' in options:
+        print("Erreur : L'option --numpy ne s'utilise qu'avec --batch")
+        return
     
     content_of_file = file_name.read_text().strip()
     lines_of_sudoku = content_of_file.split('\n')
@@ -145,18 +1203,105 @@ def solve_sudoku_from_file() -> Optional[List[List[int]]]:
         return
     
     grid = parse_grid(lines_of_sudoku)
-    
-    if solve_sudoku(grid):
+
+    limit = get_positive_int_option(options, 'limit', 0)
+    if limit is None:
+        return
+
+    if 'count' in options:
+        # Sans --backend, le comptage passe par Dancing Links, le plus rapide pour énumérer
+        display_solution_count(count_solutions(grid, options.get('backend', COUNT_DEFAULT_BACKEND),
+                                               limit or None))
+        return
+
+    if limit and 'unique' not in options:
+        display_solutions(islice(SOLUTION_ITERATORS[backend](grid), limit))
+        return
+
+    if 'unique' in options:
+        # Une deuxième solution suffit à conclure
+        solutions = list(islice(SOLUTION_ITERATORS[backend](grid), 2))
+        if len(solutions) > 1:
+            print("Erreur : Ce Sudoku a plusieurs solutions")
+            return
+        solved = bool(solutions)
+        if solved:
+            grid = solutions[0]
+    elif 'cache' in options:
+        solved = solve_sudoku_with_cache_file(grid, backend, options)
+        if solved is None:
+            return
+    else:
+        solved = SOLVING_BACKENDS[backend](grid)
+
+    if solved:
         return grid
     else:
         print("Erreur : Ce Sudoku n'a pas de solution")
         return
 
+def solve_sudoku_with_cache_file(grid: List[List[int]], backend: str,
+                                 options: Dict[str, str]) -> Optional[bool]:
+    """Résout la grille avec le cache '--cache=FICHIER' ; None si le cache est inutilisable."""
+    cache_size = get_positive_int_option(options, 'cache-size', 10000)
+    if cache_size is None:
+        return None
+    if not options['cache']:
+        print("Erreur : L'option --cache attend un nom de fichier (ex: --cache=solutions.db)")
+        return None
+    try:
+        cache = SolutionCache(Path(options['cache']), cache_size)
+        try:
+            return solve_sudoku_cached(grid, backend, cache)
+        finally:
+            cache.close()
+    except sqlite3.Error as error:
+        print(f"Erreur : le cache {options['cache']} est inutilisable ({error})")
+        return None
+
+def solve_sudoku_batch(file_name: Path, backend: str, options: Dict[str, str]) -> None:
+    """Résout un fichier contenant une grille de 81 caractères par ligne."""
+    workers = get_positive_int_option(options, 'workers', os.cpu_count() or 1)
+    if workers is None:
+        return
+    chunk_size = get_positive_int_option(options, 'chunk-size', 256)
+    if chunk_size is None:
+        return
+
+    with file_name.open() as puzzle_file:
+        display_batch_results(iter_batch_solutions(puzzle_file, backend, workers, chunk_size,
+                                                   'numpy' in options))
+
 ############################ Affichage ############################
 def display_grid(grid: List[List[int]]) -> None:
-    """Affiche la grille de Sudoku résolue."""
+    """Affiche la grille de Sudoku résolue (valeurs séparées par des espaces au-delà de 9x9)."""
+    separator = '' if len(grid) <= 9 else ' '
     for row in grid:
-        print(''.join(map(str, row)))
+        print(separator.join(map(str, row)))
+
+def display_batch_results(results: Iterator[str]) -> None:
+    """Affiche les résultats au fil de l'eau, puis le débit sur la sortie d'erreur."""
+    start = time.perf_counter()
+    count = 0
+    for count, result in enumerate(results, 1):
+        print(result)
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"{count} grilles en {elapsed:.2f} s ({rate:.0f} grilles/s)", file=sys.stderr)
+
+def display_solutions(solutions: Iterator[List[List[int]]]) -> None:
+    """Affiche les solutions au fur et à mesure, séparées par une ligne vide."""
+    count = 0
+    for count, solution in enumerate(solutions, 1):
+        if count > 1:
+            print()
+        display_grid(solution)
+    if count == 0:
+        print("Erreur : Ce Sudoku n'a pas de solution")
+
+def display_solution_count(count: int) -> None:
+    """Affiche le nombre de solutions de la grille."""
+    print(f"Nombre de solutions : {count}")
 
 def main() -> None:
     """Fonction principale du programme."""
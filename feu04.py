@@ -1,6 +1,14 @@
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterator, List, TextIO, Tuple, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel, le moteur pur Python prend le relais
+    np = None
 
 # Types personnalisés
 Grid = List[List[str]]
@@ -58,8 +66,8 @@ def is_valid_square_at_position(grid: Grid, row: int, col: int, size: int, empty
     
     return True
 
-def find_largest_square(grid: Grid, empty_char: str) -> Optional[Square]:
-    """Trouve le plus grand carré possible (en haut à gauche en cas d'égalité)."""
+def find_largest_square_brute_force(grid: Grid, empty_char: str) -> Optional[Square]:
+    """Trouve le plus grand carré en testant toutes les positions et toutes les tailles."""
     if not grid or not grid[0]:
         return None
     
@@ -85,6 +93,224 @@ def find_largest_square(grid: Grid, empty_char: str) -> Optional[Square]:
     
     return best_position, max_size
 
+def compute_dp_row(previous: List[int], line: str, empty_char: str) -> List[int]:
+    """Calcule une ligne de la table dynamique à partir de la ligne précédente.
+
+    Chaque case reçoit la taille du plus grand carré dont elle est le coin
+    inférieur droit. Les lignes sont décalées d'une colonne : l'indice j + 1
+    correspond à la colonne j, l'indice 0 sert de bord.
+    """
+    current = [0] * (len(line) + 1)
+    for col, cell in enumerate(line):
+        if cell == empty_char:
+            current[col + 1] = 1 + min(previous[col], previous[col + 1], current[col])
+    return current
+
+def find_largest_square(grid: Grid, empty_char: str) -> Optional[Square]:
+    """Trouve le plus grand carré possible (en haut à gauche en cas d'égalité).
+
+    Programmation dynamique en une seule passe, seule la ligne précédente est
+    conservée en mémoire.
+    """
+    if not grid or not grid[0]:
+        return None
+    
+    previous = [0] * (len(grid[0]) + 1)
+    max_size = 0
+    best_position = None
+    
+    for row, line in enumerate(grid):
+        current = compute_dp_row(previous, line, empty_char)
+        row_max = max(current)
+        # Strictement supérieur : le premier coin inférieur droit rencontré pour
+        # la taille maximale donne le coin supérieur gauche le plus haut puis le
+        # plus à gauche, comme la recherche exhaustive
+        if row_max > max_size:
+            max_size = row_max
+            col = current.index(row_max) - 1
+            best_position = (row - max_size + 1, col - max_size + 1)
+        previous = current
+    
+    if best_position is None:
+        return None
+    
+    return best_position, max_size
+
+def stream_largest_square(file_path: Path) -> Optional[Tuple[str, Optional[Square]]]:
+    """Valide la carte et cherche le plus grand carré en lisant une ligne à la fois.
+
+    La mémoire utilisée dépend de la largeur de la carte et non de sa hauteur.
+    Retourne le caractère plein et le carré trouvé, ou None si la carte est invalide.
+    """
+    with file_path.open() as map_file:
+        header_line = map_file.readline().rstrip('\n')
+        rows = iter_map_rows(map_file)
+        first_row = next(rows, None)
+        
+        if first_row is None:
+            print("Erreur : Le fichier doit contenir au moins 2 lignes")
+            return None
+        
+        try:
+            height, empty_char, obstacle_char, full_char = parse_header(header_line)
+        except ValueError as e:
+            print(f"Erreur dans le header : {e}")
+            return None
+        
+        # Comme en mode normal, la hauteur est vérifiée avant tout le reste : on
+        # retient la première erreur de chaque sorte et on continue de compter
+        width = len(first_row)
+        valid_chars = empty_char + obstacle_char
+        length_error = char_error = None
+        previous = [0] * (width + 1)
+        max_size = 0
+        best_position = None
+        row_count = 0
+        
+        for row, line in enumerate(chain([first_row], rows)):
+            row_count += 1
+            if row_count > height or length_error is not None:
+                continue
+            
+            if len(line) != width:
+                length_error = f"Erreur : La ligne {row + 2} a une longueur différente"
+                continue
+            
+            if char_error is not None:
+                continue
+            invalid_chars = line.strip(valid_chars)
+            if invalid_chars:
+                char_error = f"Erreur : Caractère invalide '{invalid_chars[0]}' trouvé ligne {row + 2}"
+                continue
+            
+            current = compute_dp_row(previous, line, empty_char)
+            row_max = max(current)
+            if row_max > max_size:
+                max_size = row_max
+                col = current.index(row_max) - 1
+                best_position = (row - max_size + 1, col - max_size + 1)
+            previous = current
+    
+    if row_count != height:
+        print(f"Erreur : Hauteur annoncée {height} mais {row_count} lignes trouvées")
+        return None
+    
+    size_error = "Erreur : La carte doit avoir au moins une case" if width < 1 else None
+    for error in (length_error, size_error, char_error):
+        if error is not None:
+            print(error)
+            return None
+    
+    if best_position is None:
+        return full_char, None
+    
+    return full_char, (best_position, max_size)
+
+def find_largest_square_numpy(grid: "np.ndarray", empty_byte: int) -> Optional[Square]:
+    """Version vectorisée de find_largest_square sur une grille d'octets.
+
+    Pour chaque ligne, un carré de taille k se termine en (i, j) si un carré de
+    taille k - 1 se termine en (i - 1, j - 1) et si les colonnes vides au-dessus
+    et à gauche de la case sont au moins k : chaque ligne se calcule avec
+    quelques opérations sur des tableaux.
+    """
+    rows, cols = grid.shape
+    columns = np.arange(cols)
+    up = np.zeros(cols, dtype=np.int32)
+    previous = np.zeros(cols + 1, dtype=np.int32)  # previous[j + 1] correspond à la colonne j
+    max_size = 0
+    best_position = None
+    
+    for row in range(rows):
+        is_empty = grid[row] == empty_byte
+        up = (up + 1) * is_empty
+        last_obstacle = np.maximum.accumulate(np.where(is_empty, -1, columns))
+        left = columns - last_obstacle
+        current = np.minimum(np.minimum(previous[:-1] + 1, up), left)
+        row_max = int(current.max())
+        if row_max > max_size:
+            max_size = row_max
+            col = int(current.argmax())
+            best_position = (row - max_size + 1, col - max_size + 1)
+        previous[1:] = current
+    
+    if best_position is None:
+        return None
+    
+    return best_position, max_size
+
+def compute_band_column_runs(lines: List[str], empty_char: str) -> List[int]:
+    """Compte, pour chaque colonne d'une bande, les cases vides consécutives depuis le bas."""
+    runs = [0] * len(lines[0])
+    for line in lines:
+        runs = [run + 1 if cell == empty_char else 0 for run, cell in zip(runs, line)]
+    return runs
+
+def find_largest_square_in_band(lines: List[str], first_row: int, heights: List[int],
+                                empty_char: str) -> Optional[Square]:
+    """Trouve le plus grand carré dont la base est dans la bande.
+
+    heights donne, pour chaque colonne, le nombre de cases vides consécutives
+    juste au-dessus de la bande : les carrés qui franchissent le bord supérieur
+    sont donc trouvés. Une ligne contient la base d'un carré de taille k s'il
+    existe k colonnes consécutives de hauteur au moins k.
+    """
+    max_size = 0
+    best_position = None
+    
+    for offset, line in enumerate(lines):
+        heights = [height + 1 if cell == empty_char else 0 for height, cell in zip(heights, line)]
+        # On ne cherche que des carrés plus grands que le meilleur déjà trouvé
+        while True:
+            size = max_size + 1
+            run = 0
+            found_col = None
+            for col, height in enumerate(heights):
+                run = run + 1 if height >= size else 0
+                if run == size:
+                    found_col = col - size + 1
+                    break
+            if found_col is None:
+                break
+            max_size = size
+            best_position = (first_row + offset - size + 1, found_col)
+    
+    if best_position is None:
+        return None
+    
+    return best_position, max_size
+
+def find_largest_square_parallel(lines: List[str], empty_char: str, workers: int,
+                                 band_height: int) -> Optional[Square]:
+    """Trouve le plus grand carré en découpant la carte en bandes horizontales.
+
+    Une première passe parallèle calcule les colonnes vides au bas de chaque
+    bande, ce qui donne les hauteurs entrant dans chaque bande. Une seconde
+    passe parallèle cherche le plus grand carré de chaque bande. Les bandes
+    sont combinées dans l'ordre pour garder le carré le plus en haut à gauche.
+    """
+    starts = range(0, len(lines), band_height)
+    bands = [lines[start:start + band_height] for start in starts]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        band_runs = list(executor.map(compute_band_column_runs, bands, [empty_char] * len(bands)))
+        
+        incoming_heights = [[0] * len(lines[0])]
+        for band, runs in zip(bands[:-1], band_runs):
+            previous = incoming_heights[-1]
+            incoming_heights.append([run + height if run == len(band) else run
+                                     for run, height in zip(runs, previous)])
+        
+        results = executor.map(find_largest_square_in_band, bands, starts,
+                               incoming_heights, [empty_char] * len(bands))
+        
+        best_square = None
+        for square_info in results:
+            if square_info is not None and (best_square is None or square_info[1] > best_square[1]):
+                best_square = square_info
+    
+    return best_square
+
 def fill_square(grid: Grid, position: Position, size: int, full_char: str) -> None:
     """Remplit un carré avec le caractère plein."""
     row, col = position
@@ -92,7 +318,114 @@ def fill_square(grid: Grid, position: Position, size: int, full_char: str) -> No
         for j in range(col, col + size):
             grid[i][j] = full_char
 
+def fill_square_in_lines(lines: List[str], square_info: Optional[Square], full_char: str) -> List[str]:
+    """Remplit le carré dans des lignes de texte, en ne recopiant que les lignes qu'il couvre."""
+    if square_info is None:
+        return lines
+    (row, col), size = square_info
+    for i in range(row, row + size):
+        lines[i] = lines[i][:col] + full_char * size + lines[i][col + size:]
+    return lines
+
+class IncrementalLargestSquare:
+    """Plus grand carré d'une carte dont les obstacles changent au fil du temps.
+
+    La table dynamique complète est gardée en mémoire. Après chaque
+    modification, seules les cases en dessous et à droite de la case modifiée
+    sont recalculées, et seulement tant que leur valeur change.
+    """
+
+    def __init__(self, grid: Grid, empty_char: str, obstacle_char: str):
+        self.grid = grid
+        self.empty_char = empty_char
+        self.obstacle_char = obstacle_char
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.table = []
+        previous = [0] * (self.cols + 1)
+        for line in grid:
+            previous = compute_dp_row(previous, line, empty_char)
+            self.table.append(previous)
+        self.row_max = [max(row) for row in self.table]
+
+    def add_obstacle(self, row: int, col: int) -> None:
+        """Place un obstacle sur une case."""
+        self._set_cell(row, col, self.obstacle_char)
+
+    def remove_obstacle(self, row: int, col: int) -> None:
+        """Retire l'obstacle d'une case."""
+        self._set_cell(row, col, self.empty_char)
+
+    def largest_square(self) -> Optional[Square]:
+        """Retourne le plus grand carré (en haut à gauche en cas d'égalité)."""
+        max_size = max(self.row_max)
+        if max_size == 0:
+            return None
+        row = self.row_max.index(max_size)
+        col = self.table[row].index(max_size) - 1
+        return (row - max_size + 1, col - max_size + 1), max_size
+
+    def _set_cell(self, row: int, col: int, char: str) -> None:
+        """Modifie une case et répercute le changement sur la table."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Position ({row}, {col}) hors de la carte")
+        if self.grid[row][col] == char:
+            return
+        self.grid[row][col] = char
+        self._update_from(row, col)
+
+    def _update_from(self, row: int, col: int) -> None:
+        """Recalcule la table à partir de la case (row, col).
+
+        Une case dépend de ses voisines du haut, de gauche et en diagonale : sur
+        chaque ligne, on ne recalcule que les colonnes sous une case modifiée
+        de la ligne précédente ou à droite d'une case modifiée de la ligne.
+        """
+        zeros = [0] * (self.cols + 1)
+        first_changed, last_changed = col, col
+        for i in range(row, self.rows):
+            previous = self.table[i - 1] if i > 0 else zeros
+            current = self.table[i]
+            line = self.grid[i]
+            row_first_changed = None
+            left_changed = False
+            j = first_changed
+            while j < self.cols and (j <= last_changed + 1 or left_changed):
+                if line[j] == self.empty_char:
+                    value = 1 + min(previous[j], previous[j + 1], current[j])
+                else:
+                    value = 0
+                left_changed = value != current[j + 1]
+                if left_changed:
+                    current[j + 1] = value
+                    if row_first_changed is None:
+                        row_first_changed = j
+                    row_last_changed = j
+                j += 1
+            if row_first_changed is None:
+                break
+            self.row_max[i] = max(current)
+            first_changed, last_changed = row_first_changed, row_last_changed
+
 # Gestion d'erreurs
+KNOWN_OPTIONS = {'brute-force', 'stream', 'numpy', 'parallel', 'workers', 'band-height',
+                 'incremental'}
+
+EXCLUSIVE_OPTIONS = ('numpy', 'stream', 'incremental', 'parallel', 'brute-force')
+PARALLEL_ONLY_OPTIONS = ('workers', 'band-height')
+
+def are_compatible_options(options: Dict[str, str]) -> bool:
+    """Vérifie qu'un seul mode de résolution est demandé, et ses réglages seulement avec lui."""
+    modes = [name for name in EXCLUSIVE_OPTIONS if name in options]
+    if len(modes) > 1:
+        print(f"Erreur : L'option --{modes[1]} ne s'utilise pas avec --{modes[0]}")
+        return False
+    if 'parallel' not in options:
+        for name in PARALLEL_ONLY_OPTIONS:
+            if name in options:
+                print(f"Erreur : L'option --{name} ne s'utilise qu'avec --parallel")
+                return False
+    return True
+
 def is_valid_argument_count(arguments: List[str]) -> bool:
     """Vérifie qu'il y a exactement un argument."""
     if len(arguments) != 1:
@@ -100,6 +433,24 @@ def is_valid_argument_count(arguments: List[str]) -> bool:
         return False
     return True
 
+def has_known_options(options: Dict[str, str]) -> bool:
+    """Vérifie que toutes les options passées sont connues."""
+    for name in options:
+        if name not in KNOWN_OPTIONS:
+            print(f"Erreur : Option inconnue '--{name}'")
+            return False
+    return True
+
+def get_positive_int_option(options: Dict[str, str], name: str, default: int) -> Optional[int]:
+    """Lit une option entière strictement positive (ex: '--workers=4')."""
+    if name not in options:
+        return default
+    value = options[name]
+    if not value.isdigit() or int(value) == 0:
+        print(f"Erreur : L'option --{name} attend un entier strictement positif")
+        return None
+    return int(value)
+
 def is_valid_file(file_path: Path) -> bool:
     """Vérifie que le fichier existe."""
     if not file_path.is_file():
@@ -136,13 +487,14 @@ def has_uniform_line_length(lines: List[str]) -> bool:
 
 def has_valid_characters(lines: List[str], empty_char: str, obstacle_char: str) -> bool:
     """Vérifie que la carte ne contient que les caractères autorisés."""
-    valid_chars = {empty_char, obstacle_char}
+    valid_chars = empty_char + obstacle_char
     
     for i, line in enumerate(lines[1:], 1):
-        for char in line:
-            if char not in valid_chars:
-                print(f"Erreur : Caractère invalide '{char}' trouvé ligne {i+1}")
-                return False
+        # strip retire les caractères autorisés en tête de ligne : il reste le premier invalide
+        invalid_chars = line.strip(valid_chars)
+        if invalid_chars:
+            print(f"Erreur : Caractère invalide '{invalid_chars[0]}' trouvé ligne {i+1}")
+            return False
     return True
 
 def has_minimum_size(lines: List[str]) -> bool:
@@ -154,29 +506,154 @@ def has_minimum_size(lines: List[str]) -> bool:
         return False
     return True
 
+def is_single_byte(char: str) -> bool:
+    """Vérifie qu'un caractère du header tient sur un octet (ASCII)."""
+    return len(char.encode()) == 1
+
 # Récupération de données
 def get_arguments() -> List[str]:
     """Récupère les arguments de la ligne de commande."""
     return sys.argv[1:]
 
+def split_arguments(arguments: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Sépare les arguments positionnels des options (ex: '--brute-force')."""
+    positional = []
+    options = {}
+    for argument in arguments:
+        if argument.startswith('--'):
+            name, _, value = argument[2:].partition('=')
+            options[name] = value
+        else:
+            positional.append(argument)
+    return positional, options
+
 def read_file_lines(file_path: Path) -> List[str]:
     """Lit toutes les lignes du fichier."""
     content = file_path.read_text().rstrip('\n')
     return content.split('\n')
 
+def iter_map_rows(map_file: TextIO) -> Iterator[str]:
+    """Parcourt les lignes de la carte une à une (header déjà lu).
+
+    Comme read_file_lines, les lignes vides en fin de fichier sont ignorées.
+    """
+    pending_blank_lines = 0
+    for line in map_file:
+        line = line.rstrip('\n')
+        if not line:
+            pending_blank_lines += 1
+            continue
+        for _ in range(pending_blank_lines):
+            yield ''
+        pending_blank_lines = 0
+        yield line
+
 # Résolution
-def solve_largest_square() -> Optional[Grid]:
+def solve_largest_square_numpy(file_path: Path) -> bool:
+    """Résout la carte avec NumPy, de la lecture à l'affichage.
+
+    La carte est chargée d'un bloc en tableau d'octets et validée par des
+    opérations vectorielles. Retourne False si NumPy n'est pas disponible ou si
+    la carte sort du cas ASCII : le moteur pur Python doit alors la traiter.
+    """
+    if np is None:
+        return False
+    
+    data = file_path.read_bytes()
+    if b'\r' in data:
+        return False
+    
+    content = data.rstrip(b'\n')
+    header_end = content.find(b'\n')
+    if header_end < 0:
+        print("Erreur : Le fichier doit contenir au moins 2 lignes")
+        return True
+    
+    try:
+        header_line = content[:header_end].decode()
+    except UnicodeDecodeError:
+        return False
+    
+    try:
+        height, empty_char, obstacle_char, full_char = parse_header(header_line)
+    except ValueError as e:
+        print(f"Erreur dans le header : {e}")
+        return True
+    
+    if not all(is_single_byte(char) for char in (empty_char, obstacle_char, full_char)):
+        return False
+    
+    # Une ligne de fin est ajoutée pour que chaque ligne se termine par '\n'
+    body = content[header_end + 1:]
+    cells = np.empty(len(body) + 1, dtype=np.uint8)
+    cells[:-1] = np.frombuffer(body, dtype=np.uint8)
+    cells[-1] = ord('\n')
+    if cells.max() >= 128:
+        return False
+    
+    line_ends = np.flatnonzero(cells == ord('\n'))
+    if len(line_ends) != height:
+        print(f"Erreur : Hauteur annoncée {height} mais {len(line_ends)} lignes trouvées")
+        return True
+    
+    line_lengths = np.diff(line_ends, prepend=-1) - 1
+    width = int(line_lengths[0])
+    different_lines = np.flatnonzero(line_lengths != width)
+    if len(different_lines):
+        print(f"Erreur : La ligne {different_lines[0] + 2} a une longueur différente")
+        return True
+    
+    if width < 1:
+        print("Erreur : La carte doit avoir au moins une case")
+        return True
+    
+    lines = cells.reshape(height, width + 1)
+    grid = lines[:, :width]
+    empty_byte, obstacle_byte = ord(empty_char), ord(obstacle_char)
+    is_valid = (grid == empty_byte) | (grid == obstacle_byte)
+    if not is_valid.all():
+        row, col = divmod(int(np.argmin(is_valid)), width)
+        print(f"Erreur : Caractère invalide '{chr(grid[row, col])}' trouvé ligne {row + 2}")
+        return True
+    
+    square_info = find_largest_square_numpy(grid, empty_byte)
+    
+    if square_info is not None:
+        (row, col), size = square_info
+        grid[row:row + size, col:col + size] = ord(full_char)
+    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(lines.tobytes())
+    return True
+
+def solve_largest_square() -> Optional[Union[Grid, List[str]]]:
     """Fonction principale qui orchestre la résolution du problème."""
-    arguments = get_arguments()
+    arguments, options = split_arguments(get_arguments())
     
     if not is_valid_argument_count(arguments):
         return
     
+    if not has_known_options(options):
+        return
+    
+    if not are_compatible_options(options):
+        return
+    
     file_path = Path(arguments[0])
     
     if not is_valid_file(file_path):
         return
     
+    if 'numpy' in options and solve_largest_square_numpy(file_path):
+        return
+    
+    if 'stream' in options:
+        result = stream_largest_square(file_path)
+        if result is not None:
+            full_char, square_info = result
+            display_streamed_grid(file_path, square_info, full_char)
+        return
+    
     lines = read_file_lines(file_path)
     
     if not has_minimum_lines(lines):
@@ -202,11 +679,31 @@ def solve_largest_square() -> Optional[Grid]:
     if not has_valid_characters(lines, empty_char, obstacle_char):
         return
     
+    if 'incremental' in options:
+        grid = parse_grid(lines[1:], empty_char, obstacle_char)
+        process_edits(IncrementalLargestSquare(grid, empty_char, obstacle_char), sys.stdin)
+        return
+    
+    # Les bandes sont cherchées sur les lignes telles quelles : seules celles du
+    # carré trouvé sont recopiées pour le remplir, la grille n'est pas construite
+    if 'parallel' in options:
+        workers = get_positive_int_option(options, 'workers', os.cpu_count() or 1)
+        if workers is None:
+            return
+        band_height = get_positive_int_option(options, 'band-height', -(-height // workers))
+        if band_height is None:
+            return
+        square_info = find_largest_square_parallel(lines[1:], empty_char, workers, band_height)
+        return fill_square_in_lines(lines[1:], square_info, full_char)
+    
     # Parser la grille
     grid = parse_grid(lines[1:], empty_char, obstacle_char)
     
     # Trouver et remplir le plus grand carré
-    square_info = find_largest_square(grid, empty_char)
+    if 'brute-force' in options:
+        square_info = find_largest_square_brute_force(grid, empty_char)
+    else:
+        square_info = find_largest_square(grid, empty_char)
     
     if square_info is not None:
         position, size = square_info
@@ -214,11 +711,60 @@ def solve_largest_square() -> Optional[Grid]:
     
     return grid
 
+def process_edits(solver: IncrementalLargestSquare, edits: TextIO) -> None:
+    """Applique un flux de modifications ('add r c' / 'remove r c') ligne par ligne.
+
+    Le plus grand carré est affiché au départ puis après chaque modification.
+    """
+    display_square_info(solver.largest_square())
+    for line_number, line in enumerate(edits, 1):
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) != 3 or parts[0] not in ('add', 'remove') or not all(
+                part.isdigit() for part in parts[1:]):
+            print(f"Erreur : Modification invalide ligne {line_number} (attendu 'add r c' ou 'remove r c')")
+            continue
+        row, col = int(parts[1]), int(parts[2])
+        try:
+            if parts[0] == 'add':
+                solver.add_obstacle(row, col)
+            else:
+                solver.remove_obstacle(row, col)
+        except ValueError as e:
+            print(f"Erreur : {e}")
+            continue
+        display_square_info(solver.largest_square())
+        sys.stdout.flush()  # Le résultat est attendu avant la modification suivante
+
 # Affichage
-def display_grid(grid: Grid) -> None:
-    """Affiche la grille résultat."""
+def display_square_info(square_info: Optional[Square]) -> None:
+    """Affiche la position et la taille du plus grand carré."""
+    if square_info is None:
+        print("Aucun carré")
+        return
+    (row, col), size = square_info
+    print(f"Carré : ligne {row}, colonne {col}, taille {size}")
+
+def display_grid(grid: Union[Grid, List[str]]) -> None:
+    """Affiche la grille résultat (lignes en listes de caractères ou en chaînes)."""
     for row in grid:
-        print(''.join(row))
+        print(row if isinstance(row, str) else ''.join(row))
+
+def display_streamed_grid(file_path: Path, square_info: Optional[Square], full_char: str) -> None:
+    """Relit la carte ligne par ligne et l'affiche avec le carré rempli."""
+    if square_info is None:
+        first_row, last_row, col, size = 0, 0, 0, 0
+    else:
+        (first_row, col), size = square_info
+        last_row = first_row + size
+    
+    with file_path.open() as map_file:
+        map_file.readline()  # Header
+        for row, line in enumerate(iter_map_rows(map_file)):
+            if first_row <= row < last_row:
+                line = line[:col] + full_char * size + line[col + size:]
+            sys.stdout.write(line + '\n')
 
 def main() -> None:
     """Fonction principale du programme."""
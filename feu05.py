@@ -1,4 +1,10 @@
+import heapq
+import os
+import re
+import struct
 import sys
+import tempfile
+from array import array
 from pathlib import Path
 from collections import deque
 
@@ -62,58 +68,600 @@ def parse_grid(lines):
 
 def find_position(grid, target_char):
     """Trouve la position d'un caractère dans la grille."""
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == target_char:
-                return (row, col)
+    for row, line in enumerate(grid):
+        if target_char in line:
+            return (row, line.index(target_char))
     return None
 
-def get_neighbors(position, grid):
-    """Retourne les positions voisines valides (haut, bas, gauche, droite)."""
-    row, col = position
-    neighbors = []
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # haut, bas, gauche, droite
-    
-    for dr, dc in directions:
-        new_row, new_col = row + dr, col + dc
-        if (0 <= new_row < len(grid) and 
-            0 <= new_col < len(grid[0])):
-            neighbors.append((new_row, new_col))
-    
-    return neighbors
-
 def find_all_positions(grid, target_char):
     """Trouve toutes les positions d'un caractère dans la grille."""
     positions = []
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == target_char:
-                positions.append((row, col))
+    for row, line in enumerate(grid):
+        if target_char in line:
+            positions.extend((row, col) for col, cell in enumerate(line) if cell == target_char)
     return positions
 
+def build_flat_grid(grid, empty_char, end_positions):
+    """Construit la grille à plat, entourée d'une bordure de murs.
+
+    La case (row, col) a pour indice (row + 1) * width + (col + 1) où width est
+    la largeur avec bordure : les voisins sont à -width, +width, -1 et +1 sans
+    test de limites. Retourne la largeur, les cases praticables (vides ou
+    sorties) et les sorties, sous forme de bytearray.
+    """
+    width = len(grid[0]) + 2
+    # Table de traduction : 1 pour une case vide, 0 pour tout autre caractère
+    table = dict.fromkeys(map(ord, set().union(*grid)), 0)
+    table[ord(empty_char)] = 1
+    border = bytes(width)
+    passable = bytearray(border)
+    for row in grid:
+        passable += b'\x00' + ''.join(row).translate(table).encode('latin-1') + b'\x00'
+    passable += border
+    
+    is_exit = bytearray(len(passable))
+    for row, col in end_positions:
+        index = (row + 1) * width + col + 1
+        passable[index] = 1
+        is_exit[index] = 1
+    
+    return width, passable, is_exit
+
+def to_flat_index(position, width):
+    """Convertit une position (row, col) en indice de la grille à plat."""
+    row, col = position
+    return (row + 1) * width + col + 1
+
+def to_position(index, width):
+    """Convertit un indice de la grille à plat en position (row, col)."""
+    row, col = divmod(index, width)
+    return (row - 1, col - 1)
+
+def rebuild_path(parents, end_index, width):
+    """Reconstruit le chemin du départ jusqu'à end_index en remontant les parents."""
+    path = []
+    index = end_index
+    while index != -1:
+        path.append(to_position(index, width))
+        index = parents[index]
+    path.reverse()
+    return path
+
+EXIT_BOX_TILES = 3  # au plus 3 x 3 boîtes englobantes de sorties pour l'heuristique
+
+def build_exit_heuristic(end_positions, width):
+    """Retourne l'heuristique d'A* : une borne inférieure de la distance à la sortie la plus proche.
+
+    Les sorties sont regroupées par case d'un quadrillage 3 x 3 de leur boîte
+    englobante, et l'heuristique est la distance de Manhattan à la plus proche
+    de ces boîtes (au plus 9, quel que soit le nombre de sorties). Elle ne
+    surestime jamais la distance et varie d'au plus 1 d'une case à sa voisine :
+    le premier chemin qui atteint une sortie reste le plus court. Avec 9 sorties
+    ou moins, chacune a sa boîte et l'heuristique est exacte.
+    """
+    exits = [divmod(to_flat_index(position, width), width) for position in end_positions]
+    if len(exits) <= EXIT_BOX_TILES * EXIT_BOX_TILES:
+        boxes = [(row, row, col, col) for row, col in exits]
+    else:
+        top = min(row for row, _ in exits)
+        left = min(col for _, col in exits)
+        tile_height = (max(row for row, _ in exits) - top) // EXIT_BOX_TILES + 1
+        tile_width = (max(col for _, col in exits) - left) // EXIT_BOX_TILES + 1
+        tiles = {}
+        for row, col in exits:
+            tile = ((row - top) // tile_height, (col - left) // tile_width)
+            if tile in tiles:
+                first_row, last_row, first_col, last_col = tiles[tile]
+                tiles[tile] = (min(first_row, row), max(last_row, row), min(first_col, col), max(last_col, col))
+            else:
+                tiles[tile] = (row, row, col, col)
+        boxes = list(tiles.values())
+    
+    def heuristic(index):
+        row, col = divmod(index, width)
+        return min(max(first_row - row, 0, row - last_row) + max(first_col - col, 0, col - last_col)
+                   for first_row, last_row, first_col, last_col in boxes)
+    
+    return heuristic
+
 def bfs_shortest_path_to_any_exit(grid, start, end_positions, empty_char, wall_char):
-    """Trouve le plus court chemin vers n'importe quelle sortie."""
-    queue = deque([(start, [start])])
-    visited = {start}
+    """Trouve le plus court chemin vers n'importe quelle sortie.
+
+    Parcours en largeur sur la grille à plat : les cases visitées sont marquées
+    dans un bytearray et chaque case retient l'indice de son parent, le chemin
+    n'est reconstruit qu'une fois à la fin. Retourne le chemin, la sortie
+    atteinte et le nombre de cases développées.
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    start_index = to_flat_index(start, width)
+    if is_exit[start_index]:
+        return [start], start, 0
+    
+    # Les cases encore à visiter : une case est effacée dès qu'elle est découverte
+    unvisited = passable
+    parents = array('i', [-1]) * len(passable)
+    unvisited[start_index] = 0
+    queue = deque([start_index])
+    expanded = 0
     
     while queue:
-        current_pos, path = queue.popleft()
+        current = queue.popleft()
+        expanded += 1
+        # Voisins dans l'ordre haut, bas, gauche, droite
+        for neighbor in (current - width, current + width, current - 1, current + 1):
+            if unvisited[neighbor]:
+                unvisited[neighbor] = 0
+                parents[neighbor] = current
+                # La première sortie découverte est aussi la première à sortir de la file
+                if is_exit[neighbor]:
+                    return rebuild_path(parents, neighbor, width), to_position(neighbor, width), expanded
+                queue.append(neighbor)
+    
+    return None, None, expanded
+
+def astar_shortest_path_to_any_exit(grid, start, end_positions, empty_char, wall_char):
+    """Trouve le plus court chemin vers n'importe quelle sortie avec A*.
+
+    L'heuristique (build_exit_heuristic) est une borne inférieure de la distance
+    de Manhattan à la sortie la plus proche : elle ne surestime jamais le nombre
+    de coups restants, le premier chemin qui atteint une sortie est donc le plus
+    court.
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    start_index = to_flat_index(start, width)
+    heuristic = build_exit_heuristic(end_positions, width)
+    
+    costs = array('i', [-1]) * len(passable)
+    parents = array('i', [-1]) * len(passable)
+    costs[start_index] = 0
+    start_estimate = heuristic(start_index)
+    # (coût estimé, heuristique, indice) : à égalité on développe la case la plus proche d'une sortie
+    open_heap = [(start_estimate, start_estimate, start_index)]
+    expanded = 0
+    
+    while open_heap:
+        estimate, remaining, current = heapq.heappop(open_heap)
+        cost = estimate - remaining
+        if cost != costs[current]:
+            continue  # Entrée périmée, la case a été atteinte plus tôt
+        expanded += 1
         
-        # Vérifier si on a atteint une sortie
-        if current_pos in end_positions:
-            return path, current_pos
+        if is_exit[current]:
+            return rebuild_path(parents, current, width), to_position(current, width), expanded
         
-        for neighbor in get_neighbors(current_pos, grid):
-            row, col = neighbor
-            cell = grid[row][col]
-            
-            # On peut passer si c'est vide ou une sortie
-            if neighbor not in visited and (cell == empty_char or neighbor in end_positions):
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
+        for neighbor in (current - width, current + width, current - 1, current + 1):
+            if passable[neighbor] and (costs[neighbor] < 0 or cost + 1 < costs[neighbor]):
+                costs[neighbor] = cost + 1
+                parents[neighbor] = current
+                neighbor_remaining = heuristic(neighbor)
+                heapq.heappush(open_heap, (cost + 1 + neighbor_remaining, neighbor_remaining, neighbor))
+    
+    return None, None, expanded
+
+def bidirectional_shortest_path_to_any_exit(grid, start, end_positions, empty_char, wall_char):
+    """Trouve le plus court chemin avec un parcours en largeur dans les deux sens.
+
+    Une recherche part de l'entrée, l'autre part de toutes les sorties à la
+    fois, et on développe à chaque tour la couche la plus petite. Dès qu'une
+    couche touche l'autre recherche, le plus court raccord de cette couche donne
+    le plus court chemin.
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    start_index = to_flat_index(start, width)
+    if is_exit[start_index]:
+        return [start], start, 0
+    passable[start_index] = 1  # La recherche depuis les sorties doit pouvoir l'atteindre
+    
+    size = len(passable)
+    forward_distances = array('i', [-1]) * size
+    backward_distances = array('i', [-1]) * size
+    forward_parents = array('i', [-1]) * size
+    backward_parents = array('i', [-1]) * size  # Case suivante en direction de la sortie
+    
+    forward_distances[start_index] = 0
+    forward_layer = [start_index]
+    backward_layer = [to_flat_index(position, width) for position in end_positions]
+    for index in backward_layer:
+        backward_distances[index] = 0
+    expanded = 0
     
-    return None, None
+    while forward_layer and backward_layer:
+        is_forward = len(forward_layer) <= len(backward_layer)
+        if is_forward:
+            layer, distances, parents, other_distances = (
+                forward_layer, forward_distances, forward_parents, backward_distances)
+        else:
+            layer, distances, parents, other_distances = (
+                backward_layer, backward_distances, backward_parents, forward_distances)
+        
+        next_layer = []
+        best_length = None
+        meeting = None
+        for current in layer:
+            expanded += 1
+            for neighbor in (current - width, current + width, current - 1, current + 1):
+                if not passable[neighbor]:
+                    continue
+                if other_distances[neighbor] >= 0:
+                    length = distances[current] + 1 + other_distances[neighbor]
+                    if best_length is None or length < best_length:
+                        best_length = length
+                        meeting = (current, neighbor) if is_forward else (neighbor, current)
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distances[current] + 1
+                    parents[neighbor] = current
+                    next_layer.append(neighbor)
+        
+        if meeting is not None:
+            forward_end, backward_start = meeting
+            path = rebuild_path(forward_parents, forward_end, width)
+            index = backward_start
+            while index != -1:
+                path.append(to_position(index, width))
+                index = backward_parents[index]
+            return path, path[-1], expanded
+        
+        if is_forward:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
+    
+    return None, None, expanded
+
+def jump_point_search_to_any_exit(grid, start, end_positions, empty_char, wall_char):
+    """Trouve le plus court chemin avec Jump Point Search (déplacements sur 4 voisins).
+
+    A* ne pousse dans la file que des points de saut : on avance en ligne droite
+    tant qu'aucun voisin ne devient accessible grâce à un mur qui se termine,
+    ce qui évite d'empiler les chemins équivalents d'une grande salle vide.
+    En déplacement vertical, on s'arrête aussi si un saut horizontal depuis la
+    case trouve un point de saut. Le chemin entre deux points de saut est une
+    ligne droite, reconstituée case par case à la fin.
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    start_index = to_flat_index(start, width)
+    if is_exit[start_index]:
+        return [start], start, 0
+    heuristic = build_exit_heuristic(end_positions, width)
+    
+    def jump_horizontal(index, step):
+        while True:
+            index += step
+            if not passable[index]:
+                return -1
+            if is_exit[index]:
+                return index
+            # Voisin forcé : case libre au-dessus ou en dessous alors que celle d'avant était un mur
+            if ((passable[index - width] and not passable[index - width - step]) or
+                    (passable[index + width] and not passable[index + width - step])):
+                return index
+    
+    def jump_vertical(index, step):
+        while True:
+            index += step
+            if not passable[index]:
+                return -1
+            if is_exit[index]:
+                return index
+            if ((passable[index - 1] and not passable[index - 1 - step]) or
+                    (passable[index + 1] and not passable[index + 1 - step])):
+                return index
+            if jump_horizontal(index, 1) != -1 or jump_horizontal(index, -1) != -1:
+                return index
+    
+    costs = {start_index: 0}
+    parents = {start_index: -1}
+    start_estimate = heuristic(start_index)
+    open_heap = [(start_estimate, start_estimate, start_index)]
+    expanded = 0
+    
+    while open_heap:
+        estimate, remaining, current = heapq.heappop(open_heap)
+        cost = estimate - remaining
+        if cost != costs[current]:
+            continue  # Entrée périmée, la case a été atteinte plus tôt
+        expanded += 1
+        
+        if is_exit[current]:
+            jump_points = []
+            index = current
+            while index != -1:
+                jump_points.append(index)
+                index = parents[index]
+            jump_points.reverse()
+            path = [start]
+            for origin, target in zip(jump_points, jump_points[1:]):
+                step = width if abs(target - origin) >= width else 1
+                step = step if target > origin else -step
+                path.extend(to_position(index, width) for index in range(origin + step, target + step, step))
+            return path, to_position(current, width), expanded
+        
+        # Directions à explorer : toutes au départ, sinon tout droit et les deux perpendiculaires
+        parent = parents[current]
+        if parent == -1:
+            directions = (-width, width, -1, 1)
+        elif abs(current - parent) >= width:
+            vertical_step = width if current > parent else -width
+            directions = (vertical_step, -1, 1)
+        else:
+            horizontal_step = 1 if current > parent else -1
+            directions = (horizontal_step, -width, width)
+        
+        for step in directions:
+            if not passable[current + step]:
+                continue
+            if step in (-1, 1):
+                jump_point = jump_horizontal(current, step)
+            else:
+                jump_point = jump_vertical(current, step)
+            if jump_point == -1:
+                continue
+            jump_cost = cost + abs(jump_point - current) // abs(step)
+            if jump_point not in costs or jump_cost < costs[jump_point]:
+                costs[jump_point] = jump_cost
+                parents[jump_point] = current
+                jump_remaining = heuristic(jump_point)
+                heapq.heappush(open_heap, (jump_cost + jump_remaining, jump_remaining, jump_point))
+    
+    return None, None, expanded
+
+# Stratégies de recherche disponibles avec l'option --strategy
+SEARCH_STRATEGIES = {
+    'bfs': bfs_shortest_path_to_any_exit,
+    'astar': astar_shortest_path_to_any_exit,
+    'bidirectional': bidirectional_shortest_path_to_any_exit,
+    'jps': jump_point_search_to_any_exit,
+}
+
+def compute_exit_distances(grid, start, end_positions, empty_char):
+    """Calcule la distance à la sortie la plus proche pour chaque case.
+
+    Un seul parcours en largeur part de toutes les sorties à la fois. Retourne
+    la largeur de la grille à plat et un tableau des distances (-1 pour une case
+    inaccessible ou un mur).
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    passable[to_flat_index(start, width)] = 1  # L'entrée est une case comme une autre
+    
+    distances = array('i', [-1]) * len(passable)
+    layer = [to_flat_index(position, width) for position in end_positions]
+    for index in layer:
+        distances[index] = 0
+    
+    distance = 0
+    while layer:
+        distance += 1
+        next_layer = []
+        for current in layer:
+            for neighbor in (current - width, current + width, current - 1, current + 1):
+                if passable[neighbor] and distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    next_layer.append(neighbor)
+        layer = next_layer
+    
+    return width, distances
+
+def follow_exit_distances(distances, width, start):
+    """Descend les distances depuis start jusqu'à une sortie.
+
+    Chaque pas mène à un voisin (haut, bas, gauche, droite) plus proche d'une
+    sortie : le coût est proportionnel à la longueur du chemin. Retourne le
+    chemin et la sortie atteinte, ou (None, None) si aucune sortie n'est
+    accessible.
+    """
+    index = to_flat_index(start, width)
+    if distances[index] < 0:
+        return None, None
+    
+    path = [start]
+    while distances[index] > 0:
+        target = distances[index] - 1
+        for neighbor in (index - width, index + width, index - 1, index + 1):
+            if distances[neighbor] == target:
+                index = neighbor
+                break
+        path.append(to_position(index, width))
+    
+    return path, path[-1]
+
+# Segment horizontal de cases libres dans la grille à plat
+FREE_RUN_PATTERN = re.compile(rb'\x01+')
+
+def label_connected_components(grid, start, end_positions, empty_char):
+    """Étiquette les zones connexes de cases libres avec un union-find.
+
+    L'union-find porte sur les segments horizontaux de cases libres plutôt que
+    sur les cases : chaque segment est réuni aux segments de la ligne du dessus
+    qui le touchent. Retourne la largeur de la grille à plat, l'étiquette de
+    chaque case (-1 pour un mur) et, pour chaque étiquette, 1 si la zone
+    contient une sortie.
+    """
+    width, passable, is_exit = build_flat_grid(grid, empty_char, end_positions)
+    passable[to_flat_index(start, width)] = 1
+    
+    run_starts = []
+    run_ends = []
+    parents = []
+    
+    def find(run):
+        while parents[run] != run:
+            parents[run] = parents[parents[run]]  # Compression par moitié
+            run = parents[run]
+        return run
+    
+    # La bordure de murs sépare les lignes : un segment ne déborde jamais sur la suivante
+    previous_runs, current_runs, current_row = [], [], -1
+    for match in FREE_RUN_PATTERN.finditer(passable):
+        run_start, run_end = match.span()
+        row = run_start // width
+        if row != current_row:
+            previous_runs = current_runs if row == current_row + 1 else []
+            current_runs, current_row = [], row
+            above = 0
+        
+        run = len(parents)
+        run_starts.append(run_start)
+        run_ends.append(run_end)
+        parents.append(run)
+        current_runs.append(run)
+        
+        # Segments du dessus qui chevauchent [run_start, run_end)
+        while above < len(previous_runs) and run_ends[previous_runs[above]] + width <= run_start:
+            above += 1
+        touching = above
+        while touching < len(previous_runs) and run_starts[previous_runs[touching]] + width < run_end:
+            root, other_root = find(run), find(previous_runs[touching])
+            if root != other_root:
+                parents[max(root, other_root)] = min(root, other_root)
+            touching += 1
+    
+    labels = array('i', [-1]) * len(passable)
+    root_labels = {}
+    has_exit = array('B')
+    for run in range(len(parents)):
+        root = find(run)
+        if root not in root_labels:
+            root_labels[root] = len(has_exit)
+            has_exit.append(0)
+        run_start, run_end = run_starts[run], run_ends[run]
+        labels[run_start:run_end] = array('i', [root_labels[root]]) * (run_end - run_start)
+    
+    for position in end_positions:
+        has_exit[labels[to_flat_index(position, width)]] = 1
+    
+    return width, labels, has_exit
+
+def is_exit_reachable(labels, has_exit, width, start):
+    """Indique en temps constant si une sortie est accessible depuis start."""
+    label = labels[to_flat_index(start, width)]
+    return label >= 0 and bool(has_exit[label])
+
+class IncrementalMazeSolver:
+    """Plus court chemin vers la sortie la plus proche, réparé quand les murs changent.
+
+    Recherche LPA* menée depuis les sorties vers l'entrée (comme D* Lite avec
+    une entrée fixe). Chaque case garde son estimation g et sa valeur rhs
+    calculée à partir de ses voisins ; après l'ajout ou le retrait d'un mur,
+    seules les cases dont ces valeurs ne concordent plus sont recalculées.
+    """
+
+    INFINITY = 1 << 30
+
+    def __init__(self, grid, start, end_positions, empty_char, wall_char):
+        self.grid = grid
+        self.empty_char = empty_char
+        self.wall_char = wall_char
+        self.width, self.passable, self.is_exit = build_flat_grid(grid, empty_char, end_positions)
+        self.start_index = to_flat_index(start, self.width)
+        self.passable[self.start_index] = 1
+        self.start_row, self.start_col = divmod(self.start_index, self.width)
+        
+        size = len(self.passable)
+        self.costs = array('i', [self.INFINITY]) * size  # g : distance connue jusqu'à une sortie
+        self.lookahead = array('i', [self.INFINITY]) * size  # rhs : distance d'après les voisins
+        self.queued_keys = {}
+        self.open_heap = []
+        self.expanded = 0
+        
+        for position in end_positions:
+            index = to_flat_index(position, self.width)
+            self.lookahead[index] = 0
+            self._queue(index)
+        self._compute_shortest_path()
+
+    def add_wall(self, row, col):
+        """Place un mur sur une case libre et répare le chemin."""
+        self._set_cell(row, col, False)
+
+    def remove_wall(self, row, col):
+        """Retire un mur et répare le chemin."""
+        self._set_cell(row, col, True)
+
+    def shortest_path(self):
+        """Retourne le plus court chemin de l'entrée à une sortie et la sortie atteinte."""
+        index = self.start_index
+        if self.costs[index] >= self.INFINITY:
+            return None, None
+        
+        path = [to_position(index, self.width)]
+        while not self.is_exit[index]:
+            index = min(self._neighbors(index), key=self.costs.__getitem__)
+            path.append(to_position(index, self.width))
+        return path, path[-1]
+
+    def _set_cell(self, row, col, is_free):
+        """Modifie une case puis met à jour les cases dont elle influence la valeur."""
+        if not (0 <= row < len(self.grid) and 0 <= col < len(self.grid[0])):
+            raise ValueError(f"Position ({row}, {col}) hors du labyrinthe")
+        index = to_flat_index((row, col), self.width)
+        if index == self.start_index or self.is_exit[index]:
+            raise ValueError(f"La case ({row}, {col}) est l'entrée ou une sortie")
+        if self.passable[index] == is_free:
+            return
+        
+        self.passable[index] = is_free
+        self.grid[row][col] = self.empty_char if is_free else self.wall_char
+        self._update_cell(index)
+        for neighbor in self._neighbors(index):
+            self._update_cell(neighbor)
+        self._compute_shortest_path()
+
+    def _neighbors(self, index):
+        """Voisins praticables d'une case (haut, bas, gauche, droite)."""
+        width = self.width
+        return [neighbor for neighbor in (index - width, index + width, index - 1, index + 1)
+                if self.passable[neighbor]]
+
+    def _key(self, index):
+        """Priorité d'une case : (estimation jusqu'à l'entrée, distance à une sortie)."""
+        cost = min(self.costs[index], self.lookahead[index])
+        row, col = divmod(index, self.width)
+        return (cost + abs(row - self.start_row) + abs(col - self.start_col), cost)
+
+    def _queue(self, index):
+        """Ajoute (ou reclasse) une case dans la file de priorité."""
+        key = self._key(index)
+        self.queued_keys[index] = key
+        heapq.heappush(self.open_heap, (key, index))
+
+    def _update_cell(self, index):
+        """Recalcule rhs pour une case et la place dans la file si elle est incohérente."""
+        if not self.is_exit[index]:
+            if self.passable[index]:
+                best = min((self.costs[neighbor] for neighbor in self._neighbors(index)),
+                           default=self.INFINITY)
+                self.lookahead[index] = min(best + 1, self.INFINITY)
+            else:
+                self.lookahead[index] = self.INFINITY
+        
+        if self.costs[index] != self.lookahead[index]:
+            self._queue(index)
+        else:
+            self.queued_keys.pop(index, None)
+
+    def _compute_shortest_path(self):
+        """Traite la file jusqu'à ce que la valeur de l'entrée soit exacte."""
+        self.expanded = 0
+        start_index = self.start_index
+        while self.open_heap:
+            key, index = self.open_heap[0]
+            if self.queued_keys.get(index) != key:
+                heapq.heappop(self.open_heap)  # Entrée périmée
+                continue
+            if key >= self._key(start_index) and self.costs[start_index] == self.lookahead[start_index]:
+                break
+            
+            heapq.heappop(self.open_heap)
+            del self.queued_keys[index]
+            self.expanded += 1
+            
+            if self.costs[index] > self.lookahead[index]:
+                self.costs[index] = self.lookahead[index]
+            else:
+                self.costs[index] = self.INFINITY
+                self._update_cell(index)
+            for neighbor in self._neighbors(index):
+                self._update_cell(neighbor)
 
 def fill_path(grid, path, path_char, start_char, end_char):
     """Remplit le chemin dans la grille (sans écraser start et end)."""
@@ -122,6 +670,8 @@ def fill_path(grid, path, path_char, start_char, end_char):
             grid[row][col] = path_char
 
 # Gestion d'erreurs
+KNOWN_OPTIONS = {'strategy', 'stats', 'cache', 'starts', 'replan', 'index'}
+
 def is_valid_argument_count(arguments):
     """Vérifie qu'il y a exactement un argument."""
     if len(arguments) != 1:
@@ -129,6 +679,33 @@ def is_valid_argument_count(arguments):
         return False
     return True
 
+def has_known_options(options):
+    """Vérifie que toutes les options passées sont connues."""
+    for name in options:
+        if name not in KNOWN_OPTIONS:
+            print(f"Erreur : Option inconnue '--{name}'")
+            return False
+    return True
+
+def is_valid_strategy(strategy):
+    """Vérifie que la stratégie de recherche demandée existe."""
+    if strategy not in SEARCH_STRATEGIES:
+        print(f"Erreur : Stratégie inconnue '{strategy}' (choix : {', '.join(SEARCH_STRATEGIES)})")
+        return False
+    return True
+
+CACHE_INCOMPATIBLE_OPTIONS = ('strategy', 'stats')
+
+def are_valid_cache_options(options):
+    """Vérifie qu'aucune option de recherche n'accompagne --cache, qui n'en lance pas."""
+    if 'cache' not in options:
+        return True
+    for name in CACHE_INCOMPATIBLE_OPTIONS:
+        if name in options:
+            print(f"Erreur : L'option --{name} ne s'utilise pas avec --cache")
+            return False
+    return True
+
 def is_valid_file(file_path):
     """Vérifie que le fichier existe."""
     if not file_path.is_file():
@@ -160,6 +737,8 @@ def has_correct_dimensions(lines, expected_height, expected_width):
 def has_valid_characters(lines, valid_chars):
     """Vérifie que la grille ne contient que les caractères autorisés."""
     for i, line in enumerate(lines[1:], 1):
+        if valid_chars.issuperset(line):
+            continue
         for char in line:
             if char not in valid_chars:
                 print(f"Erreur : Caractère invalide '{char}' trouvé ligne {i+1}")
@@ -188,19 +767,145 @@ def get_arguments():
     """Récupère les arguments de la ligne de commande."""
     return sys.argv[1:]
 
+def split_arguments(arguments):
+    """Sépare les arguments positionnels des options (ex: '--strategy=astar')."""
+    positional = []
+    options = {}
+    for argument in arguments:
+        if argument.startswith('--'):
+            name, _, value = argument[2:].partition('=')
+            options[name] = value
+        else:
+            positional.append(argument)
+    return positional, options
+
 def read_file_lines(file_path):
     """Lit toutes les lignes du fichier."""
     content = file_path.read_text().rstrip('\n')
     return content.split('\n')
 
+# Fichiers de cache enregistrés à côté de la carte
+CACHE_MAGIC = b'FEU05C01'
+CACHE_HEADER = struct.Struct('<8sqqI')  # magic, mtime de la carte (ns), taille de la carte, nombre de tableaux
+CACHE_ARRAY_HEADER = struct.Struct('<cq')  # type du tableau, nombre d'éléments
+
+def get_cache_path(file_path, suffix):
+    """Retourne le chemin du fichier de cache associé à la carte (ex: 'exemple.map.dist')."""
+    return file_path.with_name(file_path.name + suffix)
+
+def load_cache(file_path, suffix):
+    """Charge les tableaux mis en cache pour la carte.
+
+    Retourne None si le cache n'existe pas, est illisible, ou si la carte a
+    changé (date de modification ou taille différente) depuis son écriture.
+    """
+    cache_path = get_cache_path(file_path, suffix)
+    if not cache_path.is_file():
+        return None
+    
+    map_stat = file_path.stat()
+    try:
+        with cache_path.open('rb') as cache_file:
+            magic, mtime_ns, size, array_count = CACHE_HEADER.unpack(cache_file.read(CACHE_HEADER.size))
+            if magic != CACHE_MAGIC or mtime_ns != map_stat.st_mtime_ns or size != map_stat.st_size:
+                return None
+            arrays = []
+            for _ in range(array_count):
+                typecode, count = CACHE_ARRAY_HEADER.unpack(cache_file.read(CACHE_ARRAY_HEADER.size))
+                values = array(typecode.decode())
+                values.fromfile(cache_file, count)
+                arrays.append(values)
+    except (OSError, EOFError, struct.error, ValueError):
+        return None
+    
+    return arrays
+
+def save_cache(file_path, suffix, arrays):
+    """Enregistre des tableaux dans le cache de la carte, avec sa date et sa taille.
+
+    Chaque écriture passe par un fichier temporaire à nom unique, remplacé
+    d'un coup : deux requêtes simultanées n'écrivent jamais dans le même
+    fichier. Retourne False si le cache ne peut pas être écrit ; les tableaux
+    calculés restent alors utilisables en mémoire.
+    """
+    cache_path = get_cache_path(file_path, suffix)
+    try:
+        map_stat = file_path.stat()
+        descriptor, temporary_name = tempfile.mkstemp(prefix=cache_path.name + '.', suffix='.tmp',
+                                                      dir=cache_path.parent)
+    except OSError:
+        return False
+    
+    try:
+        with os.fdopen(descriptor, 'wb') as cache_file:
+            cache_file.write(CACHE_HEADER.pack(CACHE_MAGIC, map_stat.st_mtime_ns, map_stat.st_size, len(arrays)))
+            for values in arrays:
+                cache_file.write(CACHE_ARRAY_HEADER.pack(values.typecode.encode(), len(values)))
+                values.tofile(cache_file)
+        os.replace(temporary_name, cache_path)  # Un cache à moitié écrit n'est jamais lu
+    except OSError:
+        try:
+            os.unlink(temporary_name)
+        except OSError:
+            pass
+        return False
+    return True
+
+def get_exit_distances(file_path, grid, start, end_positions, empty_char):
+    """Charge le champ de distances aux sorties depuis le cache, ou le calcule et l'enregistre.
+
+    Si le cache ne peut pas être écrit, le champ calculé sert quand même.
+    """
+    cached = load_cache(file_path, '.dist')
+    if cached is not None:
+        (width,), distances = cached[0], cached[1]
+        return width, distances
+    
+    width, distances = compute_exit_distances(grid, start, end_positions, empty_char)
+    save_cache(file_path, '.dist', [array('i', [width]), distances])
+    return width, distances
+
+def get_connectivity_index(file_path, grid, start, end_positions, empty_char):
+    """Charge l'index des zones connexes depuis le cache, ou le calcule et l'enregistre.
+
+    Si le cache ne peut pas être écrit, l'index calculé sert quand même.
+    """
+    cached = load_cache(file_path, '.conn')
+    if cached is not None:
+        (width,), labels, has_exit = cached
+        return width, labels, has_exit
+    
+    width, labels, has_exit = label_connected_components(grid, start, end_positions, empty_char)
+    save_cache(file_path, '.conn', [array('i', [width]), labels, has_exit])
+    return width, labels, has_exit
+
+def read_start_positions(starts_path):
+    """Lit les positions de départ d'un fichier, une position 'ligne,colonne' par ligne."""
+    positions = []
+    for line in starts_path.read_text().split('\n'):
+        line = line.strip()
+        if line:
+            positions.append(line)
+    return positions
+
 # Résolution
 def solve_maze():
     """Fonction principale qui orchestre la résolution du labyrinthe."""
-    arguments = get_arguments()
+    arguments, options = split_arguments(get_arguments())
     
     if not is_valid_argument_count(arguments):
         return
     
+    if not has_known_options(options):
+        return
+    
+    strategy = options.get('strategy', 'bfs')
+    if not is_valid_strategy(strategy):
+        return
+    
+    if not are_valid_cache_options(options):
+        return
+    
     file_path = Path(arguments[0])
     
     if not is_valid_file(file_path):
@@ -246,11 +951,44 @@ def solve_maze():
         print("Erreur : Impossible de trouver les sorties")
         return
     
+    if 'replan' in options:
+        solver = IncrementalMazeSolver(grid, start_pos, end_positions, empty_char, wall_char)
+        process_wall_edits(solver, sys.stdin, 'stats' in options)
+        return
+    
+    if 'starts' in options:
+        starts_path = Path(options['starts'])
+        if not is_valid_file(starts_path):
+            return
+        width, distances = get_exit_distances(file_path, grid, start_pos, end_positions, empty_char)
+        for start in read_start_positions(starts_path):
+            display_start_query(start, distances, width, grid, wall_char)
+        return
+    
+    # Sans sortie dans la zone de l'entrée, inutile de lancer une recherche
+    if 'index' in options:
+        width, labels, has_exit = get_connectivity_index(file_path, grid, start_pos, end_positions, empty_char)
+        if not is_exit_reachable(labels, has_exit, width, start_pos):
+            print("Erreur : Aucun chemin trouvé entre l'entrée et les sorties")
+            display_stats(0 if 'stats' in options else None)
+            return
+    
     # Trouver le plus court chemin vers n'importe quelle sortie
-    path, chosen_exit = bfs_shortest_path_to_any_exit(grid, start_pos, end_positions, empty_char, wall_char)
+    if 'cache' in options:
+        width, distances = get_exit_distances(file_path, grid, start_pos, end_positions, empty_char)
+        path, chosen_exit = follow_exit_distances(distances, width, start_pos)
+        expanded = None
+    else:
+        search = SEARCH_STRATEGIES[strategy]
+        path, chosen_exit, expanded = search(grid, start_pos, end_positions, empty_char, wall_char)
+    
+    # Nombre de cases développées, affiché seulement avec --stats
+    if 'stats' not in options:
+        expanded = None
     
     if path is None:
         print("Erreur : Aucun chemin trouvé entre l'entrée et les sorties")
+        display_stats(expanded)
         return
     
     # Remplir le chemin (exclut start et end du comptage)
@@ -259,21 +997,80 @@ def solve_maze():
     # Compter les coups (exclut la position de départ)
     moves = len(path) - 1
     
-    return grid, moves
+    return grid, moves, expanded
+
+def process_wall_edits(solver, edits, show_stats):
+    """Applique un flux de modifications de murs ('add r c' / 'remove r c') ligne par ligne.
+
+    Le nombre de coups est affiché au départ puis après chaque modification.
+    """
+    display_replanned_moves(solver, show_stats)
+    for line_number, line in enumerate(edits, 1):
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) != 3 or parts[0] not in ('add', 'remove') or not all(
+                part.isdigit() for part in parts[1:]):
+            print(f"Erreur : Modification invalide ligne {line_number} (attendu 'add r c' ou 'remove r c')")
+            continue
+        row, col = int(parts[1]), int(parts[2])
+        try:
+            if parts[0] == 'add':
+                solver.add_wall(row, col)
+            else:
+                solver.remove_wall(row, col)
+        except ValueError as e:
+            print(f"Erreur : {e}")
+            continue
+        display_replanned_moves(solver, show_stats)
+        sys.stdout.flush()  # Le résultat est attendu avant la modification suivante
 
 # Affichage
-def display_result(grid, moves):
+def display_replanned_moves(solver, show_stats):
+    """Affiche le nombre de coups du chemin réparé par le solveur incrémental."""
+    path, _ = solver.shortest_path()
+    if path is None:
+        print("Aucun chemin trouvé entre l'entrée et les sorties")
+    else:
+        print(f"=> SORTIE ATTEINTE EN {len(path) - 1} COUPS !")
+    display_stats(solver.expanded if show_stats else None)
+
+def display_stats(expanded):
+    """Affiche le nombre de cases développées par la recherche (option --stats)."""
+    if expanded is not None:
+        print(f"Cases explorées : {expanded}")
+
+def display_start_query(start, distances, width, grid, wall_char):
+    """Affiche le nombre de coups depuis une position 'ligne,colonne' du fichier --starts."""
+    parts = start.split(',')
+    if len(parts) != 2 or not all(part.strip().isdigit() for part in parts):
+        print(f"Erreur : Position invalide '{start}' (attendu 'ligne,colonne')")
+        return
+    
+    row, col = int(parts[0]), int(parts[1])
+    if row >= len(grid) or col >= len(grid[0]) or grid[row][col] == wall_char:
+        print(f"Erreur : La position {row},{col} n'est pas une case libre du labyrinthe")
+        return
+    
+    path, _ = follow_exit_distances(distances, width, (row, col))
+    if path is None:
+        print(f"{row},{col} : Aucun chemin")
+    else:
+        print(f"{row},{col} : {len(path) - 1} COUPS")
+
+def display_result(grid, moves, expanded=None):
     """Affiche la grille résolue et le nombre de coups."""
     for row in grid:
         print(''.join(row))
     print(f"=> SORTIE ATTEINTE EN {moves} COUPS !")
+    display_stats(expanded)
 
 def main():
     """Fonction principale du programme."""
     result = solve_maze()
     if result:
-        grid, moves = result
-        display_result(grid, moves)
+        grid, moves, expanded = result
+        display_result(grid, moves, expanded)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file